@@ -16,24 +16,377 @@ Usage:
     python replace_bytecode.py <target_file>
     python replace_bytecode.py <target_file> --dry-run
     python replace_bytecode.py <target_file> --no-backup
+    python replace_bytecode.py <target_file> --no-verify
+    python replace_bytecode.py <target_file> --fsync
+    python replace_bytecode.py <target_file> --show-preexisting
     python replace_bytecode.py <target_file> --old-file old.txt --new-file new.txt
 """
 
 import argparse
+import mmap
 import os
+import random
 import shutil
 import sys
 import tempfile
 import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
 
-def normalize_hex(hex_str: str) -> str:
+def normalize_hex(hex_bytes: bytes) -> bytes:
     """Strip 0x prefix and whitespace."""
-    return hex_str.strip().removeprefix("0x").removeprefix("0X")
+    hex_bytes = hex_bytes.strip()
+    # One prefix check and at most one slice — pasted bytecode can run to 50 KB+
+    if hex_bytes[:1] == b"0" and hex_bytes[1:2] in (b"x", b"X"):
+        return hex_bytes[2:]
+    return hex_bytes
+
+
+# Block size for the chunked fallback when a file cannot be memory-mapped
+_CHUNK_SIZE = 16 * 1024 * 1024
+
+# Temp-file write buffer: many small gap/bytecode writes become few large write(2) calls
+_WRITE_BUFFER = 16 * 1024 * 1024
+
+# Files at least this large are scanned across all CPU cores
+_PARALLEL_MIN_SIZE = 64 * 1024 * 1024
+
+# Needles longer than this are located by a short tail anchor, then confirmed
+_ANCHOR_MIN_LEN = 4096
+_ANCHOR_LEN = 256
+
+# Rewritten offsets read back by the post-write spot check
+_VERIFY_SAMPLES = 100
+
+# Linux FICLONE ioctl: share the source's extents on reflink filesystems (Btrfs, XFS)
+_FICLONE = 0x40049409
+
+
+def _clone_file(src, dst):
+    """Copy src to dst, preferring kernel-side copies over a userspace read/write.
+
+    copy_file_range() reflinks on CoW filesystems and otherwise copies inside
+    the kernel; FICLONE is tried next; shutil.copy2 is the portable fallback.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if n == 0:
+                        break
+                    remaining -= n
+            if remaining == 0:
+                shutil.copystat(src, dst)
+                return
+        except OSError:
+            pass
+    try:
+        import fcntl
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        shutil.copystat(src, dst)
+        return
+    except (ImportError, OSError):
+        pass
+    shutil.copy2(src, dst)
+
+
+def _advise(fd: int, *advice: str):
+    """Best-effort page-cache hints; a no-op where posix_fadvise is missing (Windows, macOS)."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for name in advice:
+        try:
+            os.posix_fadvise(fd, 0, 0, getattr(os, name))
+        except OSError:
+            pass
+
+
+def _preallocate(fd: int, size: int):
+    """Reserve size bytes for fd up front; best-effort, skipped where unsupported."""
+    if size <= 0 or not hasattr(os, "posix_fallocate"):
+        return
+    try:
+        os.posix_fallocate(fd, 0, size)
+    except OSError:
+        pass
 
 
-def replace_bytecode(target_path, old_bc, new_bc, dry_run=False, backup=True):
+def _map(f):
+    """Map f read-only, or return None if it can't be (e.g. >2 GB on a 32-bit build)."""
+    try:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError, OverflowError):
+        return None
+
+
+def _find(hay, needle: bytes, start: int = 0, end: int = None) -> int:
+    """hay.find(needle, start, end), anchored on the needle's tail when it is long.
+
+    find() redoes its O(len(needle)) two-way preprocessing on every call, so for
+    20-50 KB runtime bytecode each hit pays about as much setup as it costs to
+    scan the match itself. Searching for the last _ANCHOR_LEN bytes instead —
+    they hold the CBOR metadata hash solc appends, unique per build — keeps the
+    setup constant, and the full needle is only compared at candidate offsets.
+    """
+    if end is None:
+        end = len(hay)
+    if len(needle) <= _ANCHOR_MIN_LEN:
+        return hay.find(needle, start, end)
+    lead = len(needle) - _ANCHOR_LEN
+    anchor = needle[lead:]
+    j = start + lead
+    while (j := hay.find(anchor, j, end)) >= 0:
+        if hay[j - lead:j + _ANCHOR_LEN] == needle:
+            return j - lead
+        j += 1
+    return -1
+
+
+def _count_range(mm, needle: bytes, start: int, end: int) -> int:
+    """Count non-overlapping occurrences of needle in mm[start:end]."""
+    count = 0
+    step = len(needle)
+    while True:
+        i = _find(mm, needle, start, end)
+        if i < 0:
+            return count
+        count += 1
+        start = i + step
+
+
+def _iter_hits(mm, needle: bytes):
+    """Yield the offset of every non-overlapping occurrence of needle in mm."""
+    step = len(needle)
+    pos = 0
+    while (i := _find(mm, needle, pos)) >= 0:
+        yield i
+        pos = i + step
+
+
+def _scan(mm, old_b: bytes, new_b: bytes, out=None, in_place=False, plan=None, count_new=False) -> tuple:
+    """Classify old and new bytecode hits in one pass over mm.
+
+    Every old_b hit is recorded (and swapped for new_b when out is given, or
+    overwritten in mm itself when in_place); with count_new, new_b hits are
+    counted in the untouched gaps between them while those bytes are still
+    hot in cache. A plan from _parallel_plan supplies both up front instead.
+    Returns (positions, pre_existing) with positions the old_b offsets.
+    """
+    positions = [] if plan is None else plan[0]
+    pre_existing = 0
+    step = len(old_b)
+    pos = 0
+    hits = _iter_hits(mm, old_b) if plan is None else positions
+    # Per-hit work is a handful of C calls; keep the loop to pre-bound locals
+    write = out.write if out is not None else None
+    record = positions.append if plan is None else None
+    # Slicing mm copies; slicing a view of it hands write() the mapped pages directly.
+    # The view must be released before the caller can close the mapping.
+    with memoryview(mm) as mv:
+        for i in hits:
+            if record is not None:
+                if count_new:
+                    pre_existing += _count_range(mm, new_b, pos, i)
+                record(i)
+            if in_place:
+                mm[i:i + step] = new_b
+            elif write is not None:
+                write(mv[pos:i])
+                write(new_b)
+            pos = i + step
+        if plan is None:
+            if count_new:
+                pre_existing += _count_range(mm, new_b, pos, len(mm))
+        else:
+            pre_existing = plan[1]
+        if out is not None:
+            out.write(mv[pos:])
+    return positions, pre_existing
+
+
+def _hits_in(mm, needle: bytes, start: int, end: int) -> list:
+    """Offsets of the non-overlapping needle hits that start in [start, end)."""
+    hits = []
+    step = len(needle)
+    stop = min(len(mm), end + step - 1)
+    while (i := _find(mm, needle, start, stop)) >= 0:
+        hits.append(i)
+        start = i + step
+    return hits
+
+
+def _hits_worker(path, needle: bytes, start: int, end: int) -> list:
+    """Process-pool entry point: _hits_in over a private mapping of path."""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return _hits_in(mm, needle, start, end)
+
+
+def _count_gaps_worker(path, needle: bytes, gaps: list) -> int:
+    """Process-pool entry point: count needle inside each (start, end) gap of path."""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return sum(_count_range(mm, needle, start, end) for start, end in gaps)
+
+
+def _parallel_plan(path, mm, old_b: bytes, new_b: bytes, workers: int, count_new=False) -> tuple:
+    """Find old_b hits (and, with count_new, new_b in the gaps between them) across processes.
+
+    The file is split into one range per worker, each scanned with
+    len(old_b) - 1 bytes of overlap. If a range's first hit overlaps the
+    previous range's last one, that range is rescanned serially, so the
+    result matches a single left-to-right find() loop exactly.
+    Returns (positions, pre_existing) for _scan.
+    """
+    size = len(mm)
+    span = -(-size // workers)
+    starts = range(0, size, span)
+    ends = [min(start + span, size) for start in starts]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        positions = []
+        resume = 0
+        for end, hits in zip(ends, pool.map(_hits_worker, repeat(path), repeat(old_b), starts, ends)):
+            if hits and hits[0] < resume:
+                hits = _hits_in(mm, old_b, resume, end)
+            positions.extend(hits)
+            if positions:
+                resume = positions[-1] + len(old_b)
+        if not count_new:
+            return positions, 0
+
+        # Hand each worker a contiguous run of gaps holding about 1/workers of the bytes
+        gaps = list(zip([0] + [i + len(old_b) for i in positions], positions + [size]))
+        groups = [[]]
+        filled = 0
+        for start, end in gaps:
+            groups[-1].append((start, end))
+            filled += end - start
+            if filled >= span:
+                groups.append([])
+                filled = 0
+        pre_existing = sum(pool.map(_count_gaps_worker, repeat(path), repeat(new_b), groups))
+    return positions, pre_existing
+
+
+def _scan_chunked(src, old_b: bytes, new_b: bytes, out=None, count_new=False) -> tuple:
+    """Chunked counterpart of _scan for files that cannot be memory-mapped.
+
+    Reads src in _CHUNK_SIZE blocks, holding back a tail one byte shorter
+    than the longer pattern so hits spanning a block boundary are not lost.
+    """
+    positions = []
+    pre_existing = 0
+    step = len(old_b)
+    keep = max(len(old_b), len(new_b)) - 1
+    buf = b""
+    offset = 0    # file offset of buf[0]
+    pos = 0       # first byte of buf not yet written out
+    new_from = 0  # first byte of buf not yet searched for new_b
+    src.seek(0)
+    while True:
+        chunk = src.read(_CHUNK_SIZE)
+        buf += chunk
+        view = memoryview(buf)
+        while True:
+            i = _find(buf, old_b, pos)
+            if i < 0:
+                break
+            if count_new:
+                pre_existing += _count_range(buf, new_b, new_from, i)
+            if out is not None:
+                out.write(view[pos:i])
+                out.write(new_b)
+            pos = new_from = i + step
+            positions.append(offset + i)
+        if not chunk:
+            if count_new:
+                pre_existing += _count_range(buf, new_b, new_from, len(buf))
+            if out is not None:
+                out.write(view[pos:])
+            return positions, pre_existing
+
+        # Emit everything that can't be the start of a hit running into the next block
+        safe = max(pos, len(buf) - keep)
+        if not count_new:
+            new_from = safe
+        while (k := _find(buf, new_b, new_from, safe)) >= 0:
+            pre_existing += 1
+            new_from = k + len(new_b)
+        if out is not None:
+            out.write(view[pos:safe])
+        # new_b hits straddling safe are counted once the next block shows where their gap ends
+        base = max(new_from, safe - len(new_b) + 1)
+        buf = buf[base:]
+        offset += base
+        pos = safe - base
+        new_from = max(0, new_from - base)
+
+
+def _patch_in_place(path, old_b: bytes, new_b: bytes, plan=None, fsync=False, count_new=False) -> tuple:
+    """Overwrite every old_b in path with the same-length new_b through a writable mapping.
+
+    Returns (positions, pre_existing) like _scan.
+    """
+    with open(path, "r+b") as f, mmap.mmap(f.fileno(), 0) as mm:
+        result = _scan(mm, old_b, new_b, in_place=True, plan=plan, count_new=count_new)
+        if fsync:
+            mm.flush()
+    return result
+
+
+def _scan_file(src, mm, old_b: bytes, new_b: bytes, out=None, plan=None, count_new=False) -> tuple:
+    """Run _scan over the mapping, or _scan_chunked over src when unmapped."""
+    if mm is not None:
+        return _scan(mm, old_b, new_b, out, plan=plan, count_new=count_new)
+    return _scan_chunked(src, old_b, new_b, out, count_new=count_new)
+
+
+def _contains(src, mm, needle: bytes) -> bool:
+    """True if needle occurs in the file; stops at the first hit."""
+    if mm is not None:
+        return _find(mm, needle) >= 0
+    src.seek(0)
+    tail = b""
+    while chunk := src.read(_CHUNK_SIZE):
+        buf = tail + chunk
+        if needle in buf:
+            return True
+        tail = buf[max(0, len(buf) - len(needle) + 1):]
+    return False
+
+
+def _verify_sample(path, old_b: bytes, new_b: bytes, positions: list) -> bool:
+    """Spot-check the rewrite instead of rescanning the whole file.
+
+    Reads new_b back at a random sample of the rewritten offsets, then checks
+    that no old_b is left with a find() that stops at the first hit.
+    """
+    delta = len(new_b) - len(old_b)
+    picks = sorted(random.sample(range(len(positions)), min(_VERIFY_SAMPLES, len(positions))))
+    with open(path, "rb") as f:
+        for k in picks:
+            # The k hits before this one have each shifted it by delta bytes
+            f.seek(positions[k] + k * delta)
+            if f.read(len(new_b)) != new_b:
+                return False
+        if old_b in new_b:
+            # Every rewritten hit still contains old_b; the spot check is all we can do
+            return True
+        mm = _map(f)
+        try:
+            return not _contains(f, mm, old_b)
+        finally:
+            if mm is not None:
+                mm.close()
+            # Last read of the file in this run — don't leave it crowding the page cache
+            _advise(f.fileno(), "POSIX_FADV_DONTNEED")
+
+
+def replace_bytecode(target_path, old_bc, new_bc, dry_run=False, backup=True, verify=True, fsync=False,
+                     show_preexisting=False):
     target = Path(target_path)
     if not target.exists():
         print(f"  Error: File not found: {target}")
@@ -42,100 +395,152 @@ def replace_bytecode(target_path, old_bc, new_bc, dry_run=False, backup=True):
     file_size = target.stat().st_size
     print(f"\n  Target:       {target}")
     print(f"  File size:    {file_size:,} bytes ({file_size / 1024 / 1024:.1f} MB)")
-    print(f"  Old bytecode: {old_bc[:40]}...{old_bc[-20:]}  ({len(old_bc)} chars)")
-    print(f"  New bytecode: {new_bc[:40]}...{new_bc[-20:]}  ({len(new_bc)} chars)")
+    print(f"  Old bytecode: {old_bc[:40].decode()}...{old_bc[-20:].decode()}  ({len(old_bc)} chars)")
+    print(f"  New bytecode: {new_bc[:40].decode()}...{new_bc[-20:].decode()}  ({len(new_bc)} chars)")
 
     if old_bc == new_bc:
         print("\n  Old and new bytecode are identical. Nothing to do.")
         return 0
 
-    print(f"\n  Reading file...")
-    t0 = time.time()
-    content = target.read_text(encoding="utf-8")
-    print(f"  Read in {time.time() - t0:.2f}s")
-
-    # Count — try without prefix first, then with 0x
-    count = content.count(old_bc)
-    if count == 0:
-        count = content.count("0x" + old_bc)
-        if count > 0:
-            old_bc = "0x" + old_bc
-            new_bc = "0x" + new_bc
-            print(f"  (Matched with '0x' prefix)")
-
-    # Count pre-existing instances of the new bytecode (already replaced previously)
-    pre_existing = content.count(new_bc)
-    print(f"  Found {count:,} occurrence(s)")
-    if pre_existing > 0:
-        print(f"  Pre-existing new bytecode: {pre_existing:,} (already replaced previously)")
-
-    if count == 0:
+    if file_size == 0:
         print("  No matches found.")
         return 0
 
-    if dry_run:
-        print(f"\n  DRY RUN — {count:,} replacement(s) would be made. File not modified.")
-        return count
+    with open(target, "rb") as src:
+        mm = _map(src)
+        try:
+            # Single front-to-back pass: ask for aggressive readahead on the mapping
+            _advise(src.fileno(), "POSIX_FADV_SEQUENTIAL", "POSIX_FADV_WILLNEED")
+            if mm is None:
+                print(f"  (File cannot be memory-mapped — streaming in {_CHUNK_SIZE // 1024 // 1024} MB chunks)")
+            elif hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            print(f"\n  Scanning file...")
+            t0 = time.time()
+
+            # Probe for the first hit only. The pattern is unprefixed, so it also
+            # matches inside every "0x..." occurrence and the prefix is left as-is.
+            if not _contains(src, mm, old_bc):
+                if show_preexisting:
+                    # Count-only pass: with old == new every hit lands in the first slot
+                    hits, _ = _scan_file(src, mm, new_bc, new_bc)
+                    print(f"  Pre-existing new bytecode: {len(hits):,} (already replaced previously)")
+                print("  No matches found.")
+                return 0
+
+            # Large mapped files are scanned across all cores up front; the write
+            # pass then just walks the precomputed hit offsets
+            plan = None
+            workers = os.cpu_count() or 1
+            if mm is not None and file_size >= _PARALLEL_MIN_SIZE and workers > 1:
+                plan = _parallel_plan(target, mm, old_bc, new_bc, workers, count_new=show_preexisting)
+
+            if dry_run:
+                positions, pre_existing = _scan_file(src, mm, old_bc, new_bc, plan=plan,
+                                                     count_new=show_preexisting)
+                count = len(positions)
+                print(f"  Scanned in {time.time() - t0:.2f}s")
+                print(f"  Found {count:,} occurrence(s)")
+                if show_preexisting:
+                    print(f"  Pre-existing new bytecode: {pre_existing:,} (already replaced previously)")
+                print(f"\n  DRY RUN — {count:,} replacement(s) would be made. File not modified.")
+                return count
+
+            if backup:
+                bak = str(target) + ".bak"
+                print(f"  Backup: {bak}")
+                _clone_file(target, bak)
+
+            # Same-size bytecode on a mappable file is patched in place once the
+            # read-only mapping is closed — no temp file and no full-file rewrite
+            in_place = mm is not None and len(old_bc) == len(new_bc)
+            if not in_place:
+                # Count and replace in a single pass, streaming straight from the
+                # source so the rewritten content is never held in memory as a whole
+                tmp_dir = target.parent
+                print(f"  Replacing into temp file...")
+                t0 = time.time()
+                fd, tmp_path = tempfile.mkstemp(dir=tmp_dir, suffix=".tmp", prefix="genesis_")
+                try:
+                    with os.fdopen(fd, "wb", buffering=_WRITE_BUFFER) as f:
+                        # Reserve the whole output in one allocation: exact when the hits
+                        # are already planned, else the input size as a close estimate
+                        _preallocate(f.fileno(), file_size + len(plan[0]) * (len(new_bc) - len(old_bc))
+                                     if plan is not None else file_size)
+                        positions, pre_existing = _scan_file(src, mm, old_bc, new_bc, out=f, plan=plan,
+                                                             count_new=show_preexisting)
+                        f.truncate()  # drop whatever part of the reservation went unused
+                        f.flush()
+                        if fsync:
+                            os.fsync(f.fileno())
+                        if not verify:
+                            _advise(f.fileno(), "POSIX_FADV_DONTNEED")
+                    _advise(src.fileno(), "POSIX_FADV_DONTNEED")
+                except Exception as e:
+                    print(f"  ERROR during write: {e}")
+                    if os.path.exists(tmp_path):
+                        os.unlink(tmp_path)
+                    print("  Aborted. Original file untouched.")
+                    return 0
+        finally:
+            if mm is not None:
+                mm.close()
+
+    if in_place:
+        print(f"  Patching in place (same-length bytecode)...")
+        t0 = time.time()
+        try:
+            positions, pre_existing = _patch_in_place(target, old_bc, new_bc, plan, fsync,
+                                                      count_new=show_preexisting)
+        except Exception as e:
+            print(f"  ERROR during write: {e}")
+            if backup:
+                _clone_file(bak, target)
+                print(f"  Restored from backup.")
+            else:
+                print("  Aborted. File may be partially patched.")
+            return 0
+    count = len(positions)
+    print(f"  Found {count:,} occurrence(s)")
+    if show_preexisting:
+        print(f"  Pre-existing new bytecode: {pre_existing:,} (already replaced previously)")
 
-    if backup:
-        bak = str(target) + ".bak"
-        print(f"  Backup: {bak}")
-        shutil.copy2(str(target), bak)
-
-    print(f"  Replacing...")
-    t0 = time.time()
-    new_content = content.replace(old_bc, new_bc)
-    print(f"  Replaced in {time.time() - t0:.2f}s")
-
-    # Write to a temp file first, verify size, then swap in
-    tmp_dir = target.parent
-    print(f"  Writing to temp file...")
-    t0 = time.time()
-    fd, tmp_path = tempfile.mkstemp(dir=tmp_dir, suffix=".tmp", prefix="genesis_")
-    try:
-        with os.fdopen(fd, "wb") as f:
-            data = new_content.encode("utf-8")
-            expected_size = len(data)
-            f.write(data)
-            f.flush()
-            os.fsync(f.fileno())
-
-        tmp_size = os.path.getsize(tmp_path)
-        if tmp_size != expected_size:
-            print(f"  ERROR: Temp file size mismatch! Expected {expected_size:,}, got {tmp_size:,}")
-            os.unlink(tmp_path)
+    if in_place:
+        print(f"  Patched in {time.time() - t0:.2f}s  ({file_size:,} bytes, +0)")
+    else:
+        # The mapping is closed here — Windows refuses to replace a mapped file
+        expected_size = file_size + count * (len(new_bc) - len(old_bc))
+        try:
+            tmp_size = os.path.getsize(tmp_path)
+            if tmp_size != expected_size:
+                print(f"  ERROR: Temp file size mismatch! Expected {expected_size:,}, got {tmp_size:,}")
+                os.unlink(tmp_path)
+                print("  Aborted. Original file untouched.")
+                return 0
+
+            # Atomic-ish replace: remove original, rename temp
+            os.replace(tmp_path, str(target))
+            new_size = target.stat().st_size
+            print(f"  Written in {time.time() - t0:.2f}s  ({new_size:,} bytes, {new_size - file_size:+,})")
+
+        except Exception as e:
+            print(f"  ERROR during write: {e}")
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
             print("  Aborted. Original file untouched.")
             return 0
 
-        # Atomic-ish replace: remove original, rename temp
-        os.replace(tmp_path, str(target))
-        new_size = target.stat().st_size
-        print(f"  Written in {time.time() - t0:.2f}s  ({new_size:,} bytes, {new_size - file_size:+,})")
-
-    except Exception as e:
-        print(f"  ERROR during write: {e}")
-        if os.path.exists(tmp_path):
-            os.unlink(tmp_path)
-        print("  Aborted. Original file untouched.")
-        return 0
-
-    # Free memory before verify
-    del new_content
-    del data
+    if not verify:
+        return count
 
-    # Verify
     print(f"  Verifying...")
-    verify = target.read_text(encoding="utf-8")
-    remaining = verify.count(old_bc)
-    found_new = verify.count(new_bc)
-    print(f"  Verify: old remaining={remaining:,}  new found={found_new:,}")
-
-    if remaining > 0 or found_new != count + pre_existing:
+    if not _verify_sample(target, old_bc, new_bc, positions):
         print(f"  WARNING: Verification mismatch! Restoring backup...")
         if backup:
-            shutil.copy2(bak, str(target))
+            _clone_file(bak, target)
             print(f"  Restored from backup.")
         return 0
+    print(f"  Verify: {min(_VERIFY_SAMPLES, count):,} sampled replacement(s) OK, no old bytecode remaining")
 
     return count
 
@@ -145,6 +550,11 @@ def main():
     parser.add_argument("target", help="Path to the file to modify (e.g., genesis.json)")
     parser.add_argument("--dry-run", action="store_true", help="Count matches without modifying")
     parser.add_argument("--no-backup", action="store_true", help="Skip .bak backup")
+    parser.add_argument("--no-verify", action="store_true", help="Skip the post-write spot check")
+    parser.add_argument("--show-preexisting", action="store_true",
+                        help="Also count copies of the new bytecode already in the file (extra search work)")
+    parser.add_argument("--fsync", action="store_true",
+                        help="Flush the rewritten file to disk before swapping it in (slower, survives power loss)")
     parser.add_argument("--old-file", help="Read OLD bytecode from this text file instead of prompting")
     parser.add_argument("--new-file", help="Read NEW bytecode from this text file instead of prompting")
     args = parser.parse_args()
@@ -154,21 +564,23 @@ def main():
     print("=" * 60)
 
     if args.old_file:
-        old_input = Path(args.old_file).read_text(encoding="utf-8").strip()
+        old_input = Path(args.old_file).read_bytes().strip()
         print(f"\n  Old bytecode loaded from: {args.old_file}  ({len(old_input)} chars)")
     else:
         print("\n  Paste the OLD bytecode to find (then press Enter):")
-        old_input = input("  > ").strip()
+        print("  > ", end="", flush=True)
+        old_input = sys.stdin.buffer.readline().strip()
     if not old_input:
         print("  Error: No bytecode provided.")
         sys.exit(1)
 
     if args.new_file:
-        new_input = Path(args.new_file).read_text(encoding="utf-8").strip()
+        new_input = Path(args.new_file).read_bytes().strip()
         print(f"  New bytecode loaded from: {args.new_file}  ({len(new_input)} chars)")
     else:
         print("\n  Paste the NEW bytecode to replace with (then press Enter):")
-        new_input = input("  > ").strip()
+        print("  > ", end="", flush=True)
+        new_input = sys.stdin.buffer.readline().strip()
     if not new_input:
         print("  Error: No bytecode provided.")
         sys.exit(1)
@@ -182,6 +594,9 @@ def main():
         new_bc,
         dry_run=args.dry_run,
         backup=not args.no_backup,
+        verify=not args.no_verify,
+        fsync=args.fsync,
+        show_preexisting=args.show_preexisting,
     )
 
     print(f"\n  Done. {count:,} replacement(s).\n")
@@ -33,6 +33,7 @@ Usage:
 """
 
 import argparse
+import hashlib
 import json
 import os
 import sys
@@ -40,6 +41,7 @@ import re
 import shutil
 import ssl
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Fix SSL certificate verification issues on Windows
@@ -76,6 +78,12 @@ except ImportError:
     subprocess.check_call([sys.executable, "-m", "pip", "install", "py-solc-x"])
     import solcx
 
+# Optional faster JSON encoder for artifact writes
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Patch requests to use our SSL certs (fixes solcx download issues)
 try:
     import requests
@@ -92,7 +100,7 @@ try:
         return _original_request(self, method, url, **kwargs)
     requests.Session.request = _patched_request
 except ImportError:
-    pass
+    requests = None
 
 
 # ────────────────────────────────────────────
@@ -105,35 +113,150 @@ APP_DIR = Path(__file__).parent.resolve()
 CONTRACTS_DIR = APP_DIR.parent.parent / "Contracts"
 OUTPUT_DIR = APP_DIR / "compiled_output"
 IMPORT_CACHE_DIR = APP_DIR / ".import_cache"
+# Per-root source fingerprints, used to skip recompiling unchanged roots
+BUILD_CACHE_PATH = OUTPUT_DIR / ".build_cache.json"
+
+# Concurrent connections used to fetch missing remote imports
+_DOWNLOAD_WORKERS = 16
+# Threads used to write artifact files
+_WRITE_WORKERS = 8
+
+# One keep-alive session shared by every import download, so a cold cache
+# reuses a few TLS connections instead of opening one per file.
+if requests is not None:
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    _http_session = requests.Session()
+    _http_session.mount("https://", HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=_DOWNLOAD_WORKERS,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+    ))
+else:
+    _http_session = None
+
+# URLs that failed to download in the current batch; reset by _compile_roots
+_failed_urls = set()
+
+# {path: ((st_mtime_ns, st_size), bytes)} — see _read_source
+_source_cache = {}
+
+# import "path"; and import {X} from "path"; with either quote style.
+# Both patterns scan raw file bytes; only the captured paths get decoded.
+_IMPORT_RE = re.compile(rb"""import\s+(?:\{[^}]*\}\s+from\s+)?["']([^"']+)["']\s*;""")
+# Any from "path" clause, catching import forms _IMPORT_RE does not
+_FROM_RE = re.compile(rb"""from\s+["']([^"']+)["']""")
+# https://github.com/<owner>/<repo>/blob/<ref>/<path>
+_GITHUB_BLOB_RE = re.compile(r"https://github\.com/([^/]+/[^/]+)/blob/([^/]+)/(.+)")
 
 
 def _download_file(raw_url: str, local_path: Path) -> bool:
-    """Download a file from a URL to a local path. Returns True on success."""
+    """Download a file from a URL to a local path. Returns True on success.
+
+    URLs that already failed during this batch are not retried."""
+    if raw_url in _failed_urls:
+        return False
     local_path.parent.mkdir(parents=True, exist_ok=True)
     print(f"  Downloading: {raw_url}")
     try:
-        req = urllib.request.urlopen(raw_url, context=_ssl_context)
-        local_path.write_bytes(req.read().replace(b"\r\n", b"\n"))
+        if _http_session is not None:
+            resp = _http_session.get(raw_url, timeout=30)
+            resp.raise_for_status()
+            body = resp.content
+        else:
+            body = urllib.request.urlopen(raw_url, context=_ssl_context).read()
+        # Write via a temp file so an interrupted download never leaves a
+        # truncated file that later runs would treat as cached.
+        part = local_path.with_name(local_path.name + ".part")
+        part.write_bytes(body.replace(b"\r\n", b"\n"))
+        os.replace(part, local_path)
         return True
     except Exception as e:
         print(f"  Warning: Failed to download {raw_url}: {e}")
+        _failed_urls.add(raw_url)
         return False
 
 
+def _read_source(path: Path) -> bytes:
+    """Read a source file, reusing the previous read while it is unchanged.
+
+    The staging, dependency-graph and fingerprint passes all read the same
+    files; entries are keyed by path and revalidated against
+    ``(st_mtime_ns, st_size)`` so each file is read from disk once per
+    change rather than once per pass.
+    """
+    key = str(path)
+    st = os.stat(key)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _source_cache.get(key)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    data = Path(key).read_bytes()
+    _source_cache[key] = (stamp, data)
+    return data
+
+
+def _write_source(path: Path, data: bytes):
+    """Write a source file and record its new contents in the read cache."""
+    path.write_bytes(data)
+    st = path.stat()
+    _source_cache[str(path)] = ((st.st_mtime_ns, st.st_size), data)
+
+
+def _find_imports(data: bytes, pattern=_IMPORT_RE) -> list:
+    """Return the import paths ``pattern`` captures in ``data``, decoded."""
+    return [m.decode("utf-8", errors="replace") for m in pattern.findall(data)]
+
+
+def _rewrite_imports(content: bytes, rewrites: dict) -> bytes:
+    """Replace import paths per ``rewrites`` in a single pass.
+
+    Only the quoted path inside each matched import statement is touched, so
+    the same URL appearing in a comment or string literal is left alone.
+    """
+    def _sub(m):
+        new = rewrites.get(m.group(1))
+        if new is None:
+            return m.group(0)
+        stmt = m.group(0)
+        start, end = m.start(1) - m.start(0), m.end(1) - m.start(0)
+        return stmt[:start] + new + stmt[end:]
+
+    return _IMPORT_RE.sub(_sub, content)
+
+
+def _download_many(downloads: dict) -> None:
+    """Download ``{local_path: raw_url}`` pairs concurrently.
+
+    The fetches are network-bound, so overlapping them on a thread pool cuts
+    a cold-cache run from one round trip per import to roughly one per batch.
+    """
+    if not downloads:
+        return
+    with ThreadPoolExecutor(max_workers=min(_DOWNLOAD_WORKERS, len(downloads))) as pool:
+        list(pool.map(_download_file, downloads.values(), downloads.keys()))
+
+
+def _github_target(import_path: str, cache_dir: Path) -> tuple:
+    """Map a GitHub blob URL to (raw_url, local cache path), or None."""
+    # Match: https://github.com/OpenZeppelin/openzeppelin-contracts-upgradeable/blob/v4.9.0/contracts/...
+    gh_match = _GITHUB_BLOB_RE.match(import_path)
+    if not gh_match:
+        return None
+    repo = gh_match.group(1)
+    ref = gh_match.group(2)
+    file_path = gh_match.group(3)
+    raw_url = f"https://raw.githubusercontent.com/{repo}/{ref}/{file_path}"
+    return raw_url, cache_dir / repo.replace("/", "_") / ref / file_path
+
+
 def resolve_github_import(import_path: str, cache_dir: Path) -> Path:
     """Download and cache a GitHub import URL, returning the local path."""
-    # Match: https://github.com/OpenZeppelin/openzeppelin-contracts-upgradeable/blob/v4.9.0/contracts/...
-    gh_match = re.match(
-        r"https://github\.com/([^/]+/[^/]+)/blob/([^/]+)/(.+)", import_path
-    )
-    if gh_match:
-        repo = gh_match.group(1)
-        ref = gh_match.group(2)
-        file_path = gh_match.group(3)
-        raw_url = f"https://raw.githubusercontent.com/{repo}/{ref}/{file_path}"
-        local_path = cache_dir / repo.replace("/", "_") / ref / file_path
-    else:
+    target = _github_target(import_path, cache_dir)
+    if not target:
         return None
+    raw_url, local_path = target
 
     if local_path.exists():
         return local_path
@@ -197,9 +320,9 @@ def _extract_version_from_cache_path(file_path: Path, cache_dir: Path) -> str:
     return None
 
 
-def _resolve_openzeppelin_import(import_path: str, importing_file: Path, cache_dir: Path) -> Path:
+def _openzeppelin_github_url(import_path: str, importing_file: Path, cache_dir: Path) -> str:
     """
-    Resolve @openzeppelin/... imports by downloading from the correct GitHub repo.
+    Map @openzeppelin/... imports to a GitHub blob URL in the correct repo.
 
     Maps:
       @openzeppelin/contracts/X        → OpenZeppelin/openzeppelin-contracts,          contracts/X
@@ -218,54 +341,100 @@ def _resolve_openzeppelin_import(import_path: str, importing_file: Path, cache_d
     else:
         return None
 
-    github_url = f"https://github.com/{repo}/blob/{version}/contracts/{suffix}"
+    return f"https://github.com/{repo}/blob/{version}/contracts/{suffix}"
+
+
+def _resolve_openzeppelin_import(import_path: str, importing_file: Path, cache_dir: Path) -> Path:
+    """Resolve @openzeppelin/... imports by downloading from the correct GitHub repo."""
+    github_url = _openzeppelin_github_url(import_path, importing_file, cache_dir)
+    if not github_url:
+        return None
     return resolve_github_import(github_url, cache_dir)
 
 
+def _import_target(imp: str, sol_file: Path, cache_dir: Path) -> tuple:
+    """
+    Work out where an import lives locally and how to fetch it if missing.
+
+    Returns (local_path, raw_url, rewrite), or None for imports that are not
+    handled.  ``raw_url`` is None when the file is already on disk;
+    ``rewrite`` is True when the import text must be replaced by a relative
+    path to ``local_path``.
+    """
+    if imp.startswith("http://") or imp.startswith("https://"):
+        # Direct GitHub URL import
+        target = _github_target(imp, cache_dir)
+        rewrite = True
+    elif imp.startswith("@openzeppelin/"):
+        # Resolve @openzeppelin package imports by downloading from GitHub
+        github_url = _openzeppelin_github_url(imp, sol_file, cache_dir)
+        target = _github_target(github_url, cache_dir) if github_url else None
+        rewrite = True
+    elif imp.startswith("@"):
+        return None  # other package imports not handled
+    else:
+        # Relative import — check if it already exists locally, otherwise
+        # try to reconstruct the GitHub URL and download
+        resolved = (sol_file.parent / imp).resolve()
+        if resolved.exists():
+            return resolved, None, False
+        raw_url = _infer_github_url(sol_file, imp, cache_dir)
+        return (resolved, raw_url, False) if raw_url else None
+
+    if not target:
+        return None
+    raw_url, local_path = target
+    return local_path, None if local_path.exists() else raw_url, rewrite
+
+
 def resolve_imports_in_file(sol_file: Path, cache_dir: Path, _visited: set = None):
     """Read a .sol file, download any GitHub imports, and rewrite them to local paths.
-    Also resolves relative imports in cached GitHub files by reconstructing URLs."""
+    Also resolves relative imports in cached GitHub files by reconstructing URLs.
+
+    The import graph is walked breadth-first with an explicit worklist: every
+    file at one depth is scanned, all of their missing imports are fetched
+    together, and the files that still need walking form the next level."""
     if _visited is None:
         _visited = set()
-    sol_file = sol_file.resolve()
-    if sol_file in _visited:
-        return
-    _visited.add(sol_file)
 
-    content = sol_file.read_text(encoding="utf-8", errors="replace")
-    # Match: import "path"; and import {X} from "path";
-    imports = re.findall(r'import\s+(?:\{[^}]*\}\s+from\s+)?"([^"]+)";', content)
-    imports += re.findall(r"import\s+(?:\{[^}]*\}\s+from\s+)?'([^']+)';", content)
-
-    for imp in imports:
-        if imp.startswith("http://") or imp.startswith("https://"):
-            # Direct GitHub URL import
-            local = resolve_github_import(imp, cache_dir)
-            if local:
-                rel = os.path.relpath(str(local), str(sol_file.parent)).replace("\\", "/")
-                content = content.replace(imp, rel)
-        elif imp.startswith("@openzeppelin/"):
-            # Resolve @openzeppelin package imports by downloading from GitHub
-            local = _resolve_openzeppelin_import(imp, sol_file, cache_dir)
-            if local:
-                rel = os.path.relpath(str(local), str(sol_file.parent)).replace("\\", "/")
-                content = content.replace(imp, rel)
-        elif imp.startswith("@"):
-            continue  # other package imports not handled
-        else:
-            # Relative import — check if it already exists locally
-            resolved = (sol_file.parent / imp).resolve()
-            if resolved.exists():
-                # Already exists; recurse into it
-                resolve_imports_in_file(resolved, cache_dir, _visited)
-            else:
-                # Not on disk — try to reconstruct the GitHub URL and download
-                raw_url = _infer_github_url(sol_file, imp, cache_dir)
-                if raw_url:
-                    if _download_file(raw_url, resolved):
-                        resolve_imports_in_file(resolved, cache_dir, _visited)
-
-    sol_file.write_text(content, encoding="utf-8", newline="\n")
+    level = [sol_file.resolve()]
+    while level:
+        scanned = []
+        downloads = {}
+        for current in level:
+            if current in _visited:
+                continue
+            _visited.add(current)
+
+            content = _read_source(current)
+            targets = []
+            for imp in _find_imports(content):
+                target = _import_target(imp, current, cache_dir)
+                if target:
+                    targets.append((imp, *target))
+            downloads.update((local, url) for _, local, url, _ in targets if url)
+            scanned.append((current, content, targets))
+
+        _download_many(downloads)
+
+        level = []
+        for current, content, targets in scanned:
+            rewrites = {}
+            for imp, local, raw_url, rewrite in targets:
+                if not local.exists():
+                    continue  # download failed; warning already printed
+                if rewrite:
+                    rel = os.path.relpath(str(local), str(current.parent)).replace("\\", "/")
+                    rewrites[imp.encode("utf-8")] = rel.encode("utf-8")
+                # Cached remote files were resolved when first downloaded; local
+                # and freshly downloaded files still need their imports walked.
+                if raw_url or not rewrite:
+                    level.append(local)
+
+            # Leave files without remote imports untouched so their mtime (and
+            # the read cache) stay valid across runs.
+            if rewrites:
+                _write_source(current, _rewrite_imports(content, rewrites))
 
 
 def prepare_source(sol_path: str, cache_dir: Path) -> Path:
@@ -300,11 +469,22 @@ def _copy_normalized(src: Path, dst: Path):
 
     solc includes a keccak256 of each source file in the IPFS metadata hash
     appended to the bytecode.  Windows CRLF vs Unix LF produces different
-    hashes, so we strip \\r\\n -> \\n before writing to the build directory."""
-    normalized = src.read_bytes().replace(b"\r\n", b"\n")
-    if dst.exists() and dst.read_bytes() == normalized:
+    hashes, so we strip \\r\\n -> \\n before writing to the build directory.
+
+    A destination with the same size that is no older than the source was
+    staged from it already, and is skipped without reading either file."""
+    try:
+        st_dst = dst.stat()
+    except FileNotFoundError:
+        st_dst = None
+    if st_dst is not None:
+        st_src = src.stat()
+        if st_src.st_size == st_dst.st_size and st_src.st_mtime_ns <= st_dst.st_mtime_ns:
+            return
+    normalized = _read_source(src).replace(b"\r\n", b"\n")
+    if st_dst is not None and _read_source(dst) == normalized:
         return
-    dst.write_bytes(normalized)
+    _write_source(dst, normalized)
 
 
 def copy_local_tree(src_file: Path, work_dir: Path,
@@ -325,11 +505,7 @@ def copy_local_tree(src_file: Path, work_dir: Path,
     dst.parent.mkdir(parents=True, exist_ok=True)
     _copy_normalized(src_file, dst)
 
-    content = src_file.read_text(encoding="utf-8", errors="replace")
-    imports = re.findall(r'import\s+"([^"]+)";', content)
-    imports += re.findall(r"import\s+'([^']+)';", content)
-
-    for imp in imports:
+    for imp in _find_imports(_read_source(src_file)):
         if imp.startswith("http") or imp.startswith("@"):
             continue
         imp_path = (src_file.parent / imp).resolve()
@@ -380,6 +556,11 @@ def clamp_evm_version(solc_version: str, evm_version: str) -> str:
     return evm_version
 
 
+_PRAGMA_RE = re.compile(r"pragma\s+solidity\s+(.+?);")
+# One alternation covers every bound we understand; "<=" must precede "<".
+_PRAGMA_CONSTRAINT_RE = re.compile(r"(?P<op>>=|<=|<|\^)\s*0\.8\.(?P<patch>\d+)")
+
+
 def get_pragma_constraints(source: str) -> tuple:
     """
     Parse pragma solidity constraints and return (min_version, max_version).
@@ -387,33 +568,31 @@ def get_pragma_constraints(source: str) -> tuple:
     Handles: >=0.8.2 <0.8.20, ^0.8.0, ^0.8.2, >=0.8.0, etc.
     Returns (min, max) as tuples of ints, e.g. ((0,8,2), (0,8,20)) or None for no bound.
     """
-    match = re.search(r"pragma\s+solidity\s+(.+?);", source)
+    match = _PRAGMA_RE.search(source)
     if not match:
         return None, None
 
-    constraint = match.group(1).strip()
+    # First occurrence of each operator, collected in a single scan
+    bounds = {}
+    for m in _PRAGMA_CONSTRAINT_RE.finditer(match.group(1).strip()):
+        bounds.setdefault(m.group("op"), int(m.group("patch")))
+
     min_ver = None
     max_ver = None
 
     # >=X.Y.Z
-    m = re.search(r">=\s*(0\.8\.(\d+))", constraint)
-    if m:
-        min_ver = (0, 8, int(m.group(2)))
+    if ">=" in bounds:
+        min_ver = (0, 8, bounds[">="])
 
-    # <X.Y.Z  (strict upper bound)
-    m = re.search(r"<\s*(0\.8\.(\d+))", constraint)
-    if m:
-        max_ver = (0, 8, int(m.group(2)) - 1)  # exclusive → inclusive
-
-    # <=X.Y.Z
-    m = re.search(r"<=\s*(0\.8\.(\d+))", constraint)
-    if m:
-        max_ver = (0, 8, int(m.group(2)))
+    # <=X.Y.Z, else <X.Y.Z (strict upper bound, exclusive → inclusive)
+    if "<=" in bounds:
+        max_ver = (0, 8, bounds["<="])
+    elif "<" in bounds:
+        max_ver = (0, 8, bounds["<"] - 1)
 
     # ^X.Y.Z  (>=X.Y.Z, <0.9.0 effectively — but for 0.8.x it means >=X.Y.Z <0.9.0)
-    m = re.search(r"\^\s*(0\.8\.(\d+))", constraint)
-    if m:
-        min_ver = (0, 8, int(m.group(2)))
+    if "^" in bounds:
+        min_ver = (0, 8, bounds["^"])
         if max_ver is None:
             max_ver = (0, 8, 99)  # effectively no 0.8.x upper bound
 
@@ -426,6 +605,22 @@ def _ver_tuple(version_str: str) -> tuple:
     return tuple(int(p) for p in parts)
 
 
+# Newest-first installed solc versions; reset whenever install_solc adds one
+_installed_versions_cache = None
+
+
+def _installed() -> list:
+    """Installed solc versions, newest first, scanned once per install."""
+    global _installed_versions_cache
+    if _installed_versions_cache is None:
+        _installed_versions_cache = sorted(
+            [str(v) for v in solcx.get_installed_solc_versions()],
+            key=lambda v: _ver_tuple(v),
+            reverse=True,  # prefer newest
+        )
+    return _installed_versions_cache
+
+
 def pick_solc_version(source: str) -> str:
     """
     Choose the best installed solc version that satisfies the pragma.
@@ -433,13 +628,7 @@ def pick_solc_version(source: str) -> str:
     """
     min_ver, max_ver = get_pragma_constraints(source)
 
-    installed = sorted(
-        [str(v) for v in solcx.get_installed_solc_versions()],
-        key=lambda v: _ver_tuple(v),
-        reverse=True,  # prefer newest
-    )
-
-    for v in installed:
+    for v in _installed():
         vt = _ver_tuple(v)
         if min_ver and vt < min_ver:
             continue
@@ -455,37 +644,33 @@ def pick_solc_version(source: str) -> str:
 
 def install_solc(version: str):
     """Install the specified solc version if not already installed."""
-    installed = [str(v) for v in solcx.get_installed_solc_versions()]
-    if version not in installed:
+    global _installed_versions_cache
+    if version not in _installed():
         print(f"Installing solc {version}...")
         solcx.install_solc(version)
+        _installed_versions_cache = None
     solcx.set_solc_version(version)
 
 
-def compile_contract(
+def _prepare_contract(
     sol_path: str,
     solc_version: str = None,
     evm_version: str = DEFAULT_EVM_VERSION,
-    contract_name: str = None,
     optimize: bool = True,
     optimize_runs: int = 200,
 ) -> dict:
     """
-    Compile a Solidity file and return bytecode info for all contracts.
+    Select and install the compiler, then stage the sources for one file.
 
-    Returns dict of:
-        {contract_name: {
-            "runtime_bytecode": "0x...",
-            "creation_bytecode": "0x...",
-            "abi": [...],
-            "opcodes": "...",
-        }}
+    Returns a job dict consumed by ``_run_solc``.  Everything here touches
+    shared state (the solcx install dir and ``.import_cache/source``), so
+    batch callers run it serially and only parallelise ``_run_solc``.
     """
     sol_path = Path(sol_path).resolve()
     if not sol_path.exists():
         raise FileNotFoundError(f"File not found: {sol_path}")
 
-    source = sol_path.read_text(encoding="utf-8", errors="replace")
+    source = _read_source(sol_path).decode("utf-8", errors="replace")
 
     # Determine solc version
     if not solc_version:
@@ -520,53 +705,70 @@ def compile_contract(
     print("Resolving imports...")
     work_file = prepare_source(str(sol_path), IMPORT_CACHE_DIR)
 
-    # Build allow-paths for local imports
-    allow_paths = [
-        str(work_file.parent),
-        str(IMPORT_CACHE_DIR),
-        str(sol_path.parent),
-    ]
+    return {
+        "work_file": work_file,
+        "solc_version": solc_version,
+        "evm_version": evm_version,
+        "optimize": optimize,
+        "optimize_runs": optimize_runs,
+        # Build allow-paths for local imports
+        "allow_paths": [
+            str(work_file.parent),
+            str(IMPORT_CACHE_DIR),
+            str(sol_path.parent),
+        ],
+    }
+
+
+def _source_rel_path(source_file: Path) -> str:
+    """Artifact-relative path for a staged or cached source file.
+
+    Local contracts map to their path relative to the Contracts tree.
+    External cached dependencies are grouped under External/<owner>/<repo>/
+    <version>/..., so artifact layout stays deterministic and clearly
+    separated from in-repo contracts.
+    """
+    source_file = source_file.resolve()
+    try:
+        return str(source_file.relative_to((IMPORT_CACHE_DIR / "source").resolve()))
+    except ValueError:
+        try:
+            return str(normalize_external_source_rel_path(source_file.relative_to(IMPORT_CACHE_DIR.resolve())))
+        except ValueError:
+            return str(Path("External") / source_file.name)
+
+
+# Naming basis of solc source units (see _source_unit_name); part of the
+# build-cache fingerprint, so change it whenever the naming changes.
+_SOURCE_UNIT_BASIS = "base_path=APP_DIR"
 
-    # Compile
+
+def _source_unit_name(path: Path) -> str:
+    """Source unit name solc gives ``path`` when run with ``base_path=APP_DIR``.
+
+    solc writes these names into each contract's metadata, whose hash is
+    part of the bytecode, so both compile paths must name sources alike:
+    relative to ``APP_DIR`` (``.import_cache/source/...``), never by the
+    checkout's absolute path.
+    """
     try:
-        compiled = solcx.compile_files(
-            [str(work_file)],
-            output_values=[
-                "abi",
-                "bin",
-                "bin-runtime",
-                "opcodes",
-                "metadata",
-            ],
-            solc_version=solc_version,
-            evm_version=evm_version,
-            optimize=optimize,
-            optimize_runs=optimize_runs,
-            allow_paths=allow_paths,
-        )
-    except solcx.exceptions.SolcError as e:
-        print(f"\nCompilation failed:\n{e}")
-        sys.exit(1)
+        return path.resolve().relative_to(APP_DIR).as_posix()
+    except ValueError:
+        return path.resolve().as_posix()
+
+
+def _collect_results(entries) -> dict:
+    """Shape ``(source_path, name, contract_data)`` entries into the results dict.
 
+    ``contract_data`` uses solc's combined-json keys (``bin``, ``bin-runtime``,
+    ...), whichever solc interface produced it.  Results are keyed by
+    ``(source_rel_path, name)``: a batched run covers several roots, and two
+    of them may each define a contract of the same name.
+    """
     results = {}
-    source_base = (IMPORT_CACHE_DIR / "source").resolve()
-    cache_base = IMPORT_CACHE_DIR.resolve()
-    for key, contract_data in compiled.items():
-        # key format: "path:ContractName"
-        name = key.split(":")[-1]
-
-        # Determine source path relative to the local Contracts tree first.
-        # External cached dependencies are grouped under External/<owner>/<repo>/
-        # <version>/..., so artifact layout stays deterministic and clearly
-        # separated from in-repo contracts.
-        source_file = Path(key.rsplit(":", 1)[0]).resolve()
-        try:
-            source_rel = str(source_file.relative_to(source_base))
-        except ValueError:
-            try:
-                source_rel = str(normalize_external_source_rel_path(source_file.relative_to(cache_base)))
-            except ValueError:
-                source_rel = str(Path("External") / source_file.name)
+    for source_path, name, contract_data in entries:
+        # solc reports source unit names, relative to APP_DIR (its base path)
+        source_rel = _source_rel_path(APP_DIR / source_path)
 
         # Skip interfaces and abstract contracts (empty bytecode)
         runtime = contract_data.get("bin-runtime", "")
@@ -574,20 +776,157 @@ def compile_contract(
         if not runtime and not creation:
             continue
 
-        results[name] = {
+        results[(source_rel, name)] = {
             "runtime_bytecode": f"0x{runtime}" if runtime else "",
             "creation_bytecode": f"0x{creation}" if creation else "",
             "abi": contract_data.get("abi", []),
             "opcodes": contract_data.get("opcodes", ""),
             "metadata": contract_data.get("metadata", ""),
-            "runtime_size_bytes": len(bytes.fromhex(runtime)) if runtime else 0,
-            "creation_size_bytes": len(bytes.fromhex(creation)) if creation else 0,
+            # solc emits plain even-length hex, two characters per byte
+            "runtime_size_bytes": len(runtime) >> 1,
+            "creation_size_bytes": len(creation) >> 1,
             "source_rel_path": source_rel,
         }
 
     return results
 
 
+def _run_solc(job: dict) -> dict:
+    """Run solc for a job from ``_prepare_contract`` and collect its contracts.
+
+    The compiler version is passed explicitly rather than read from solcx's
+    global selection, so several jobs can run on threads at once.
+    """
+    try:
+        compiled = solcx.compile_files(
+            [str(job["work_file"])],
+            output_values=[
+                "abi",
+                "bin",
+                "bin-runtime",
+                "opcodes",
+                "metadata",
+            ],
+            solc_version=job["solc_version"],
+            evm_version=job["evm_version"],
+            optimize=job["optimize"],
+            optimize_runs=job["optimize_runs"],
+            base_path=str(APP_DIR),
+            allow_paths=job["allow_paths"],
+        )
+    except solcx.exceptions.SolcError as e:
+        print(f"\nCompilation failed:\n{e}")
+        sys.exit(1)
+
+    # key format: "path:ContractName"
+    return _collect_results(
+        (*key.rsplit(":", 1), contract_data) for key, contract_data in compiled.items()
+    )
+
+
+def _run_solc_standard(jobs: list) -> dict:
+    """Compile several jobs sharing one compiler configuration in a single
+    ``solc --standard-json`` run.
+
+    Shared imports are parsed and analysed once instead of once per root.
+    ``solc --standard-json`` reads a single input document up to EOF and
+    exits, so one process per compiler configuration is as warm as solc
+    can be kept; batching roots into that one document is what amortises
+    its startup.  Raises ``solcx.exceptions.SolcError`` so the caller can fall back to
+    per-file compilation and attribute the failure.
+    """
+    first = jobs[0]
+    allow_paths = []
+    for job in jobs:
+        allow_paths += [p for p in job["allow_paths"] if p not in allow_paths]
+
+    output = solcx.compile_standard(
+        {
+            "language": "Solidity",
+            "sources": {
+                _source_unit_name(job["work_file"]): {"urls": [job["work_file"].as_posix()]}
+                for job in jobs
+            },
+            "settings": {
+                "optimizer": {"enabled": first["optimize"], "runs": first["optimize_runs"]},
+                "evmVersion": first["evm_version"],
+                "outputSelection": {
+                    "*": {
+                        "*": [
+                            "abi",
+                            "evm.bytecode.object",
+                            "evm.bytecode.opcodes",
+                            "evm.deployedBytecode.object",
+                            "metadata",
+                        ],
+                    },
+                },
+            },
+        },
+        solc_version=first["solc_version"],
+        base_path=str(APP_DIR),
+        allow_paths=allow_paths,
+    )
+
+    return _collect_results(
+        (source_path, name, {
+            "abi": data.get("abi", []),
+            "bin": data.get("evm", {}).get("bytecode", {}).get("object", ""),
+            "bin-runtime": data.get("evm", {}).get("deployedBytecode", {}).get("object", ""),
+            "opcodes": data.get("evm", {}).get("bytecode", {}).get("opcodes", ""),
+            "metadata": data.get("metadata", ""),
+        })
+        for source_path, contracts in output.get("contracts", {}).items()
+        for name, data in contracts.items()
+    )
+
+
+def _run_bucket(jobs: list) -> dict:
+    """Compile jobs that share a compiler configuration.
+
+    Falls back to one solc run per file when the batched run fails, so the
+    error is reported against the file that caused it.
+    """
+    if len(jobs) > 1:
+        try:
+            return _run_solc_standard(jobs)
+        except solcx.exceptions.SolcError:
+            print("  Batched compile failed — retrying file by file")
+    results = {}
+    for job in jobs:
+        results.update(_run_solc(job))
+    return results
+
+
+def compile_contract(
+    sol_path: str,
+    solc_version: str = None,
+    evm_version: str = DEFAULT_EVM_VERSION,
+    contract_name: str = None,
+    optimize: bool = True,
+    optimize_runs: int = 200,
+) -> dict:
+    """
+    Compile a Solidity file and return bytecode info for all contracts.
+
+    Returns dict of:
+        {contract_name: {
+            "runtime_bytecode": "0x...",
+            "creation_bytecode": "0x...",
+            "abi": [...],
+            "opcodes": "...",
+        }}
+    """
+    results = _run_solc(_prepare_contract(
+        sol_path,
+        solc_version=solc_version,
+        evm_version=evm_version,
+        optimize=optimize,
+        optimize_runs=optimize_runs,
+    ))
+    return {name: data for (_, name), data in results.items()}
+
+
 # ────────────────────────────────────────────
 # Output formatting
 # ────────────────────────────────────────────
@@ -622,22 +961,69 @@ def print_results(results: dict, contract_name: str = None):
         print()
 
 
-def save_results(results: dict, output_dir: str, quiet: bool = False):
-    """Save compilation artifacts to files."""
-    out = Path(output_dir)
-    out.mkdir(parents=True, exist_ok=True)
-    for name, data in results.items():
+def _dumps(obj) -> bytes:
+    """Encode ``obj`` as 2-space-indented UTF-8 JSON.
+
+    Uses orjson when installed.  The stdlib fallback is configured to emit
+    the same bytes (non-ASCII kept as UTF-8), so artifacts do not depend on
+    which encoder was available.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+# Stand-in for the ABI while encoding a full artifact; see _artifact_files
+_ABI_PLACEHOLDER = "__abi__"
+
+
+def _artifact_files(name: str, data: dict, out: Path) -> list:
+    """Return the ``(path, bytes)`` artifact files for one contract.
+
+    The ABI is usually the bulk of an artifact and would otherwise be
+    encoded twice.  It is encoded once for ``_abi.json`` and spliced into
+    the full artifact, re-indented one level, which yields the same bytes
+    as encoding the artifact whole.
+    """
+    abi_json = _dumps(data["abi"])
+    artifact_json = _dumps({**data, "abi": _ABI_PLACEHOLDER}).replace(
+        b'"' + _ABI_PLACEHOLDER.encode() + b'"', abi_json.replace(b"\n", b"\n  "), 1
+    )
+    files = [
         # Runtime bytecode
-        (out / f"{name}_runtime.bin").write_text(data["runtime_bytecode"], newline="\n")
+        (out / f"{name}_runtime.bin", data["runtime_bytecode"].encode("ascii")),
         # Creation bytecode
-        (out / f"{name}_creation.bin").write_text(data["creation_bytecode"], newline="\n")
+        (out / f"{name}_creation.bin", data["creation_bytecode"].encode("ascii")),
         # ABI
-        (out / f"{name}_abi.json").write_text(json.dumps(data["abi"], indent=2), newline="\n")
+        (out / f"{name}_abi.json", abi_json),
         # Full artifact
-        (out / f"{name}_artifact.json").write_text(json.dumps(data, indent=2), newline="\n")
-        # Solc metadata (the JSON whose IPFS hash is embedded in bytecode)
-        if data.get("metadata"):
-            (out / f"{name}_metadata.json").write_text(data["metadata"], newline="\n")
+        (out / f"{name}_artifact.json", artifact_json),
+    ]
+    # Solc metadata (the JSON whose IPFS hash is embedded in bytecode)
+    if data.get("metadata"):
+        files.append((out / f"{name}_metadata.json", data["metadata"].encode("utf-8")))
+    return files
+
+
+def _write_files(files: list):
+    """Write ``(path, bytes)`` pairs, creating each distinct parent once.
+
+    The writes are independent and release the GIL, so they are issued from
+    a small thread pool rather than one open/write/close at a time.
+    """
+    for parent in {path.parent for path, _ in files}:
+        parent.mkdir(parents=True, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=_WRITE_WORKERS) as pool:
+        list(pool.map(lambda item: item[0].write_bytes(item[1]), files))
+
+
+def save_results(results: dict, output_dir: str, quiet: bool = False):
+    """Save compilation artifacts to files."""
+    out = Path(output_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    _write_files([
+        item for name, data in results.items() for item in _artifact_files(name, data, out)
+    ])
 
     if not quiet:
         print(f"Artifacts saved to: {out.resolve()}")
@@ -693,20 +1079,34 @@ def get_contract_output_dir(output_root: Path, source_rel_path: str, contract_na
 # Batch directory compilation
 # ────────────────────────────────────────────
 
+def _scan_contracts(root: Path) -> list:
+    """Walk ``root`` once with ``os.scandir`` and return every .sol file, sorted.
+
+    ``DirEntry`` carries the type from the directory read, so unlike
+    ``rglob`` plus ``is_file`` this needs no extra stat per entry.
+    """
+    found = []
+    pending = [root]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                # Like rglob, do not descend into symlinked directories
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.endswith(".sol") and entry.is_file():
+                    found.append(Path(entry.path))
+    return sorted(found)
+
+
 def discover_sol_files(contracts_dir: Path) -> list:
     """Find all .sol files in the contracts directory, recursively."""
-    sol_files = sorted(contracts_dir.rglob("*.sol"))
-    return [f for f in sol_files if f.is_file()]
+    return _scan_contracts(contracts_dir)
 
 
 def get_local_imports(sol_file: Path) -> set:
     """Extract local relative import paths from a .sol file (not HTTP/package imports)."""
-    content = sol_file.read_text(encoding="utf-8", errors="replace")
-    imports = re.findall(r'import\s+"([^"]+)";', content)
-    imports += re.findall(r"import\s+'([^']+)';", content)
-    # Also match import {X} from "path" style
-    imports += re.findall(r'from\s+"([^"]+)"', content)
-    imports += re.findall(r"from\s+'([^']+)'", content)
+    content = _read_source(sol_file)
+    imports = _find_imports(content) + _find_imports(content, _FROM_RE)
 
     local_paths = set()
     for imp in imports:
@@ -718,33 +1118,240 @@ def get_local_imports(sol_file: Path) -> set:
     return local_paths
 
 
-def build_dependency_graph(contracts_dir: Path) -> tuple:
+def build_dependency_graph(contracts_dir: Path, sol_files: list = None) -> tuple:
     """
     Scan all .sol files and determine which are root contracts vs imported dependencies.
 
+    Pass ``sol_files`` from a previous ``discover_sol_files`` call to reuse
+    that walk instead of scanning ``contracts_dir`` again.
+
     Returns:
         (root_files, imported_files)
         - root_files: list of .sol files that are NOT imported by any other file
         - imported_files: set of .sol files that ARE imported by at least one other file
     """
-    all_files = [f.resolve() for f in contracts_dir.rglob("*.sol") if f.is_file()]
+    if sol_files is None:
+        sol_files = _scan_contracts(contracts_dir)
+    all_files = [f.resolve() for f in sol_files]
+    all_files_set = set(all_files)
     imported_by_others = set()
 
     for sol_file in all_files:
-        local_imports = get_local_imports(sol_file)
-        for imp in local_imports:
-            if imp in [f for f in all_files]:
-                imported_by_others.add(imp)
+        # get_local_imports already returns resolved paths
+        imported_by_others |= get_local_imports(sol_file) & all_files_set
 
     root_files = sorted([f for f in all_files if f not in imported_by_others])
     return root_files, imported_by_others
 
 
+def _source_closure(sol_file: Path) -> set:
+    """Return ``sol_file`` and every local file it imports, transitively."""
+    closure = set()
+    pending = [sol_file.resolve()]
+    while pending:
+        current = pending.pop()
+        if current in closure:
+            continue
+        closure.add(current)
+        pending.extend(get_local_imports(current) - closure)
+    return closure
+
+
+def _fingerprint(job: dict, closure: set) -> str:
+    """Hash the compiler settings and every staged source a root pulls in.
+
+    The source unit naming basis is hashed too: unit names end up in the
+    metadata hash inside the bytecode, so artifacts built under another
+    naming scheme must not be reused.  Names are relative to ``APP_DIR``
+    and paths are hashed in their artifact-relative form, so the
+    fingerprint, like the bytecode, survives moving the checkout.
+    """
+    h = hashlib.sha256()
+    h.update(repr((
+        job["solc_version"], job["evm_version"], job["optimize"], job["optimize_runs"],
+        _SOURCE_UNIT_BASIS,
+    )).encode())
+    for rel, path in sorted((_source_rel_path(p), p) for p in closure):
+        h.update(rel.encode() + b"\0")
+        h.update(hashlib.sha256(_read_source(path)).digest())
+    return h.hexdigest()
+
+
+def _load_build_cache() -> dict:
+    try:
+        return json.loads(BUILD_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _cached_results(entry: dict, fingerprint: str) -> dict:
+    """Load a root's previous artifacts if its fingerprint is unchanged."""
+    if not entry or entry.get("fingerprint") != fingerprint:
+        return None
+    results = {}
+    try:
+        for artifact in entry["artifacts"]:
+            data = json.loads((OUTPUT_DIR / artifact).read_text(encoding="utf-8"))
+            results[(data["source_rel_path"], Path(artifact).parent.name)] = data
+    except (OSError, ValueError, KeyError):
+        return None
+    return results
+
+
+def _summary_entry(data: dict, name: str, rel_path, contract_out: Path) -> dict:
+    return {
+        "source": data.get("source_rel_path", str(rel_path)),
+        "contract": name,
+        "runtime_bytes": data["runtime_size_bytes"],
+        "creation_bytes": data["creation_size_bytes"],
+        "output": str(contract_out),
+        "over_limit": data["runtime_size_bytes"] > 24576,
+    }
+
+
+def _error_entry(rel_path, error: Exception) -> dict:
+    return {
+        "source": str(rel_path),
+        "contract": "ERROR",
+        "runtime_bytes": 0,
+        "creation_bytes": 0,
+        "output": "",
+        "over_limit": False,
+        "error": str(error),
+    }
+
+
+def _compile_roots(
+    sol_files: list,
+    rel_paths: list,
+    solc_version: str = None,
+    evm_version: str = DEFAULT_EVM_VERSION,
+    optimize: bool = True,
+    optimize_runs: int = 200,
+    jobs: int = None,
+) -> tuple:
+    """
+    Compile each file in ``sol_files`` and save its artifacts.
+
+    Preparation (version pick, solc install, import staging) runs serially
+    because it mutates the shared cache.  Files that end up with the same
+    compiler settings are then compiled in one Standard JSON run; the runs
+    for different settings are independent subprocesses, so they are fanned
+    out over a thread pool and their results printed back in order.
+
+    Returns (total_compiled, total_failed, summary).
+    """
+    total_compiled = 0
+    total_failed = 0
+    summary = []
+    _failed_urls.clear()
+
+    # Roots that share a compiler configuration are compiled together in
+    # one solc run, keyed by (solc, evm, optimize, runs).
+    buckets = {}
+    build_cache = _load_build_cache()
+    for sol_file, rel_path in zip(sol_files, rel_paths):
+        print(f"\n{'─'*60}")
+        print(f"  Preparing: {rel_path}")
+        print(f"{'─'*60}")
+
+        try:
+            # Override EVM to shanghai for contracts with 'private' in the name
+            file_evm = evm_version
+            stem_lower = sol_file.stem.lower()
+            if any(pat in stem_lower for pat in _SHANGHAI_FILENAME_PATTERNS):
+                file_evm = "shanghai"
+                print(f"  ⚙  EVM override: {evm_version} → shanghai (filename contains 'private')")
+
+            job = _prepare_contract(
+                str(sol_file),
+                solc_version=solc_version,
+                evm_version=file_evm,
+                optimize=optimize,
+                optimize_runs=optimize_runs,
+            )
+            closure = _source_closure(job["work_file"])
+            fingerprint = _fingerprint(job, closure)
+        except Exception as e:
+            print(f"  FAILED: {e}")
+            total_failed += 1
+            summary.append(_error_entry(rel_path, e))
+            continue
+
+        cache_key = Path(rel_path).as_posix()
+        cached = _cached_results(build_cache.get(cache_key), fingerprint)
+        if cached is not None:
+            print(f"  Up to date — reusing {len(cached)} artifact(s)")
+            total_compiled += len(cached)
+            for (_, cname), cdata in cached.items():
+                contract_out = get_contract_output_dir(OUTPUT_DIR, cdata["source_rel_path"], cname)
+                summary.append(_summary_entry(cdata, cname, rel_path, contract_out))
+            continue
+
+        key = (job["solc_version"], job["evm_version"], job["optimize"], job["optimize_runs"])
+        buckets.setdefault(key, []).append(
+            (rel_path, job, cache_key, fingerprint, {_source_rel_path(p) for p in closure})
+        )
+
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as pool:
+        futures = [
+            (key, entries, pool.submit(_run_bucket, [entry[1] for entry in entries]))
+            for key, entries in buckets.items()
+        ]
+
+        for (bucket_solc, bucket_evm, _, _), entries, future in futures:
+            rel_path = entries[0][0] if len(entries) == 1 else f"{len(entries)} root file(s)"
+            print(f"\n{'─'*60}")
+            print(f"  Compiled: {rel_path} (solc {bucket_solc}, {bucket_evm})")
+            print(f"{'─'*60}")
+
+            try:
+                results = future.result()
+
+                if results:
+                    # Save each contract to a directory mirroring its source tree
+                    # and named after the concrete contract.
+                    files = []
+                    for (source_rel, cname), cdata in results.items():
+                        print_results({cname: cdata})
+                        contract_out = get_contract_output_dir(OUTPUT_DIR, source_rel, cname)
+                        files += _artifact_files(cname, cdata, contract_out)
+                        summary.append(_summary_entry(cdata, cname, rel_path, contract_out))
+                    _write_files(files)
+                    print(f"Artifacts saved to: {OUTPUT_DIR.resolve()}")
+                    total_compiled += len(results)
+                else:
+                    print(f"  No concrete contracts found in {rel_path}")
+
+                # Record which artifacts each root produced so an unchanged
+                # root can be skipped next run.
+                for _, _, cache_key, fingerprint, closure_rels in entries:
+                    build_cache[cache_key] = {
+                        "fingerprint": fingerprint,
+                        "artifacts": [
+                            (get_contract_output_dir(Path(), source_rel, cname)
+                             / f"{cname}_artifact.json").as_posix()
+                            for (source_rel, cname) in results
+                            if source_rel in closure_rels
+                        ],
+                    }
+
+            except Exception as e:
+                print(f"  FAILED: {e}")
+                total_failed += len(entries)
+                summary.extend(_error_entry(entry[0], e) for entry in entries)
+
+    BUILD_CACHE_PATH.write_bytes(_dumps(build_cache))
+
+    return total_compiled, total_failed, summary
+
+
 def compile_all(
     solc_version: str = None,
     evm_version: str = DEFAULT_EVM_VERSION,
     optimize: bool = True,
     optimize_runs: int = 200,
+    jobs: int = None,
 ):
     """Compile all .sol files in the contracts/ directory and output artifacts."""
     # Ensure directories exist
@@ -759,7 +1366,7 @@ def compile_all(
         return
 
     # Build dependency graph to skip imported files
-    root_files, imported_files = build_dependency_graph(CONTRACTS_DIR)
+    root_files, imported_files = build_dependency_graph(CONTRACTS_DIR, all_files)
 
     print("\n" + "=" * 60)
     print("  Solidity Runtime Bytecode Compiler")
@@ -779,79 +1386,19 @@ def compile_all(
             print(f"    {rel}  [ROOT - will compile]")
     print()
 
-    total_compiled = 0
-    total_failed = 0
-    summary = []
-
-    for sol_file in root_files:
-        rel_path = sol_file.relative_to(CONTRACTS_DIR)
-
-        print(f"\n{'─'*60}")
-        print(f"  Compiling: {rel_path}")
-        print(f"{'─'*60}")
-
-        try:
-            # Override EVM to shanghai for contracts with 'private' in the name
-            file_evm = evm_version
-            stem_lower = sol_file.stem.lower()
-            if any(pat in stem_lower for pat in _SHANGHAI_FILENAME_PATTERNS):
-                file_evm = "shanghai"
-                print(f"  ⚙  EVM override: {evm_version} → shanghai (filename contains 'private')")
-
-            results = compile_contract(
-                str(sol_file),
-                solc_version=solc_version,
-                evm_version=file_evm,
-                optimize=optimize,
-                optimize_runs=optimize_runs,
-            )
-
-            if results:
-                print_results(results)
-                # Save each contract to a directory mirroring its source tree
-                # and named after the concrete contract.
-                for cname, cdata in results.items():
-                    contract_out = get_contract_output_dir(
-                        OUTPUT_DIR,
-                        cdata.get("source_rel_path", f"{cname}.sol"),
-                        cname,
-                    )
-                    save_results({cname: cdata}, str(contract_out), quiet=True)
-                print(f"Artifacts saved to: {OUTPUT_DIR.resolve()}")
-                total_compiled += len(results)
-                for name, data in results.items():
-                    contract_out = get_contract_output_dir(
-                        OUTPUT_DIR,
-                        data.get("source_rel_path", f"{name}.sol"),
-                        name,
-                    )
-                    summary.append({
-                        "source": data.get("source_rel_path", str(rel_path)),
-                        "contract": name,
-                        "runtime_bytes": data["runtime_size_bytes"],
-                        "creation_bytes": data["creation_size_bytes"],
-                        "output": str(contract_out),
-                        "over_limit": data["runtime_size_bytes"] > 24576,
-                    })
-            else:
-                print(f"  No concrete contracts found in {rel_path}")
-
-        except Exception as e:
-            print(f"  FAILED: {e}")
-            total_failed += 1
-            summary.append({
-                "source": str(rel_path),
-                "contract": "ERROR",
-                "runtime_bytes": 0,
-                "creation_bytes": 0,
-                "output": "",
-                "over_limit": False,
-                "error": str(e),
-            })
+    total_compiled, total_failed, summary = _compile_roots(
+        root_files,
+        [f.relative_to(CONTRACTS_DIR) for f in root_files],
+        solc_version=solc_version,
+        evm_version=evm_version,
+        optimize=optimize,
+        optimize_runs=optimize_runs,
+        jobs=jobs,
+    )
 
     # Save manifest
     manifest_path = OUTPUT_DIR / "manifest.json"
-    manifest_path.write_text(json.dumps(summary, indent=2), newline="\n")
+    manifest_path.write_bytes(_dumps(summary))
 
     # Final summary
     print(f"\n{'='*60}")
@@ -888,6 +1435,7 @@ def compile_selected(
     evm_version: str = DEFAULT_EVM_VERSION,
     optimize: bool = True,
     optimize_runs: int = 200,
+    jobs: int = None,
 ):
     """Compile only the specified Solidity files and output artifacts."""
     CONTRACTS_DIR.mkdir(parents=True, exist_ok=True)
@@ -923,78 +1471,25 @@ def compile_selected(
         print(f"    {rel}")
     print()
 
-    total_compiled = 0
-    total_failed = 0
-    summary = []
-
+    rel_paths = []
     for sol_file in selected_files:
         try:
-            rel_path = sol_file.relative_to(APP_DIR.parent.parent)
+            rel_paths.append(sol_file.relative_to(APP_DIR.parent.parent))
         except ValueError:
-            rel_path = sol_file
-
-        print(f"\n{'─'*60}")
-        print(f"  Compiling: {rel_path}")
-        print(f"{'─'*60}")
-
-        try:
-            file_evm = evm_version
-            stem_lower = sol_file.stem.lower()
-            if any(pat in stem_lower for pat in _SHANGHAI_FILENAME_PATTERNS):
-                file_evm = "shanghai"
-                print(f"  ⚙  EVM override: {evm_version} → shanghai (filename contains 'private')")
-
-            results = compile_contract(
-                str(sol_file),
-                solc_version=solc_version,
-                evm_version=file_evm,
-                optimize=optimize,
-                optimize_runs=optimize_runs,
-            )
-
-            if results:
-                print_results(results)
-                for cname, cdata in results.items():
-                    contract_out = get_contract_output_dir(
-                        OUTPUT_DIR,
-                        cdata.get("source_rel_path", f"{cname}.sol"),
-                        cname,
-                    )
-                    save_results({cname: cdata}, str(contract_out), quiet=True)
-                print(f"Artifacts saved to: {OUTPUT_DIR.resolve()}")
-                total_compiled += len(results)
-                for name, data in results.items():
-                    contract_out = get_contract_output_dir(
-                        OUTPUT_DIR,
-                        data.get("source_rel_path", f"{name}.sol"),
-                        name,
-                    )
-                    summary.append({
-                        "source": data.get("source_rel_path", str(rel_path)),
-                        "contract": name,
-                        "runtime_bytes": data["runtime_size_bytes"],
-                        "creation_bytes": data["creation_size_bytes"],
-                        "output": str(contract_out),
-                        "over_limit": data["runtime_size_bytes"] > 24576,
-                    })
-            else:
-                print(f"  No concrete contracts found in {rel_path}")
-
-        except Exception as e:
-            print(f"  FAILED: {e}")
-            total_failed += 1
-            summary.append({
-                "source": str(rel_path),
-                "contract": "ERROR",
-                "runtime_bytes": 0,
-                "creation_bytes": 0,
-                "output": "",
-                "over_limit": False,
-                "error": str(e),
-            })
+            rel_paths.append(sol_file)
+
+    total_compiled, total_failed, summary = _compile_roots(
+        selected_files,
+        rel_paths,
+        solc_version=solc_version,
+        evm_version=evm_version,
+        optimize=optimize,
+        optimize_runs=optimize_runs,
+        jobs=jobs,
+    )
 
     manifest_path = OUTPUT_DIR / "manifest.json"
-    manifest_path.write_text(json.dumps(summary, indent=2), newline="\n")
+    manifest_path.write_bytes(_dumps(summary))
 
     print(f"\n{'='*60}")
     print(f"  COMPILATION SUMMARY")
@@ -1040,6 +1535,7 @@ def main():
     parser.add_argument("--evm", default=DEFAULT_EVM_VERSION, help=f"EVM version (default: {DEFAULT_EVM_VERSION})")
     parser.add_argument("--no-optimize", action="store_true", help="Disable optimizer")
     parser.add_argument("--runs", type=int, default=200, help="Optimizer runs (default: 200)")
+    parser.add_argument("--jobs", type=int, default=None, help="Parallel solc processes (default: CPU count)")
     parser.add_argument("--clean-cache", action="store_true", help="Clear the downloaded import cache")
     parser.add_argument("--clean-output", action="store_true", help="Clear previous compiled output before compiling")
 
@@ -1066,6 +1562,7 @@ def main():
             evm_version=args.evm,
             optimize=not args.no_optimize,
             optimize_runs=args.runs,
+            jobs=args.jobs,
         )
     else:
         compile_all(
@@ -1073,6 +1570,7 @@ def main():
             evm_version=args.evm,
             optimize=not args.no_optimize,
             optimize_runs=args.runs,
+            jobs=args.jobs,
         )
 
 
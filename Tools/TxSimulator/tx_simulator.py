@@ -47,16 +47,54 @@ Examples:
 """
 
 import argparse
+import asyncio
+import copy
+import hashlib
+import hmac
+import json
 import math
 import random
 import sys
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait as wait_futures
 from decimal import Decimal, getcontext
 from getpass import getpass
 from typing import Dict, List, Optional, Tuple
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from web3 import Web3
 from eth_account import Account
+from web3._utils.encoding import Web3JsonEncoder
+from eth_keys import keys as eth_keys
+from eth_utils import keccak
+
+# Optional: concurrent single requests when the RPC rejects batches
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Optional: faster JSON-RPC request encoding and response parsing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+if orjson is not None:
+    _json_dumps = orjson.dumps
+else:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+# Optional: push-based block notifications for --ws
+try:
+    from websockets.sync.client import connect as ws_connect
+except ImportError:
+    ws_connect = None
 
 getcontext().prec = 50
 
@@ -65,8 +103,55 @@ getcontext().prec = 50
 # Web3 helpers
 # ══════════════════════════════════════════════════════════════════════
 
-def setup_web3(rpc_url: str) -> Web3:
-    w3 = Web3(Web3.HTTPProvider(rpc_url, request_kwargs={"timeout": 30}))
+class _OrjsonHTTPProvider(Web3.HTTPProvider):
+    """
+    HTTPProvider that encodes JSON-RPC requests and parses responses with
+    orjson.  Types orjson cannot serialize natively (HexBytes,
+    AttributeDict) go through web3's own JSON encoder hook.
+    """
+
+    _default = staticmethod(Web3JsonEncoder().default)
+
+    def encode_rpc_request(self, method, params) -> bytes:
+        return orjson.dumps(
+            {"jsonrpc": "2.0", "method": method, "params": params or [],
+             "id": next(self.request_counter)},
+            default=self._default,
+        )
+
+    @staticmethod
+    def decode_rpc_response(raw_response: bytes):
+        return orjson.loads(raw_response)
+
+
+# Minimum keep-alive connections kept per host.  main() raises it so the
+# loop thread and every send worker can hold a connection at once.
+RPC_POOL_SIZE = 16
+
+
+def make_rpc_session(pool_size: int = RPC_POOL_SIZE) -> requests.Session:
+    """
+    One keep-alive session shared by the w3 provider and BatchRpc.
+    urllib3 already sets TCP_NODELAY on its sockets, so small JSON-RPC
+    posts are not held back by Nagle.  Failed connects are retried with a
+    short backoff; POSTs are never re-sent once they reached the node.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size,
+                          max_retries=Retry(total=3, read=0, backoff_factor=0.1))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def setup_web3(rpc_url: str, session: Optional[requests.Session] = None) -> Web3:
+    provider_cls = _OrjsonHTTPProvider if orjson is not None else Web3.HTTPProvider
+    try:
+        provider = provider_cls(rpc_url, request_kwargs={"timeout": 30}, session=session)
+    except TypeError:
+        # web3.py too old for the session kwarg — use its internal session.
+        provider = provider_cls(rpc_url, request_kwargs={"timeout": 30})
+    w3 = Web3(provider)
     if not w3.is_connected():
         raise SystemExit(f"ERROR: cannot connect to RPC: {rpc_url}")
 
@@ -88,26 +173,31 @@ def setup_web3(rpc_url: str) -> Web3:
     return w3
 
 
+_WEI = Decimal(10**18)
+
+
 def eth_to_wei(eth: Decimal) -> int:
-    return int(eth * Decimal(10**18))
+    return int(eth * _WEI)
 
 
-def wei_to_eth(wei: int) -> Decimal:
-    return Decimal(wei) / Decimal(10**18)
+def fmt_eth(wei: int) -> str:
+    """Exact ETH string for display (no Decimal division on the log path)."""
+    q, r = divmod(abs(wei), 10**18)
+    text = f"{q}.{r:018d}".rstrip("0").rstrip(".")
+    return "-" + text if wei < 0 else text
 
 
 def safe_int(x) -> int:
     return int(x) if x is not None else 0
 
 
-def get_fee_fields(w3: Web3, tip_wei: int, max_fee_multiplier: int) -> Tuple[Dict, int]:
+def get_fee_fields(w3: Web3, base_fee: Optional[int], tip_wei: int,
+                   max_fee_multiplier: int) -> Tuple[Dict, int]:
     """
-    Returns (tx_fee_fields, worst_fee_per_gas_wei).
+    Returns (tx_fee_fields, worst_fee_per_gas_wei) for the head block's
+    *base_fee* (None on pre-London chains).
     EIP-1559 type-2 when baseFeePerGas is present, legacy gasPrice otherwise.
     """
-    latest = w3.eth.get_block("latest")
-    base_fee = latest.get("baseFeePerGas", None)
-
     if base_fee is None:
         gp = safe_int(w3.eth.gas_price)
         gas_price = max(gp, tip_wei)
@@ -121,18 +211,586 @@ def get_fee_fields(w3: Web3, tip_wei: int, max_fee_multiplier: int) -> Tuple[Dic
     )
 
 
-def sign_and_send(w3: Web3, acct, tx: Dict) -> str:
+class FeeCache:
+    """
+    get_fee_fields memoized per block: baseFee (and a node's gasPrice
+    suggestion) only move when the head does, so every send within one
+    block reuses the same fields.
+    """
+
+    def __init__(self, w3: Web3, tip_wei: int, max_fee_multiplier: int):
+        self.w3 = w3
+        self.tip_wei = tip_wei
+        self.max_fee_multiplier = max_fee_multiplier
+        self._block = -1
+        self._fees: Tuple[Dict, int] = ({}, 0)
+
+    def get(self, block: int, base_fee: Optional[int]) -> Tuple[Dict, int]:
+        if block != self._block:
+            self._fees = get_fee_fields(self.w3, base_fee, self.tip_wei,
+                                        self.max_fee_multiplier)
+            self._block = block
+        return self._fees
+
+
+# SignedTransaction's raw-bytes attribute: rawTransaction on older
+# eth_account releases, raw_transaction on newer.  Resolved on first sign.
+_RAW_ATTR: Optional[str] = None
+
+
+def sign_tx(acct, tx: Dict) -> bytes:
+    """Sign *tx* and return the raw bytes for eth_sendRawTransaction."""
+    global _RAW_ATTR
     signed = acct.sign_transaction(tx)
-    raw = getattr(signed, "rawTransaction", None) or getattr(signed, "raw_transaction", None)
-    if raw is None:
-        raise RuntimeError("SignedTransaction missing raw tx bytes.")
-    return w3.eth.send_raw_transaction(raw).hex()
+    if _RAW_ATTR is None:
+        _RAW_ATTR = next(
+            (a for a in ("raw_transaction", "rawTransaction") if getattr(signed, a, None) is not None),
+            None,
+        )
+        if _RAW_ATTR is None:
+            raise RuntimeError("SignedTransaction missing raw tx bytes.")
+    return getattr(signed, _RAW_ATTR)
+
+
+def _rlp_int(x: int) -> bytes:
+    """RLP encoding of a non-negative int below 2**256."""
+    if x == 0:
+        return b"\x80"
+    if x < 0x80:
+        return bytes((x,))
+    b = x.to_bytes((x.bit_length() + 7) // 8, "big")
+    return bytes((0x80 + len(b),)) + b
+
+
+def _rlp_list(payload: bytes) -> bytes:
+    if len(payload) < 56:
+        return bytes((0xC0 + len(payload),)) + payload
+    lb = len(payload).to_bytes((len(payload).bit_length() + 7) // 8, "big")
+    return bytes((0xF7 + len(lb),)) + lb + payload
+
+
+class TemplateSigner:
+    """
+    Signs the simulator's plain value transfers (no data, no access list)
+    without going through Account.sign_transaction.
+
+    The RLP of everything fixed for the run — chainId, gas, each
+    recipient's address, the empty data / access-list tail — is encoded
+    once; a send splices in nonce, value and the block's fee fields,
+    hashes, and signs the digest with eth_keys directly (coincurve when
+    installed).  main() only uses it after verify() shows byte-identical
+    output to sign_tx for a reference tx, so any encoding drift falls
+    back to eth_account.
+    """
+
+    def __init__(self, chain_id: int, gas: int, signers: list, addresses: List[str]):
+        self.chain_id = chain_id
+        self._signers = signers
+        self._keys: List[Optional[object]] = [None] * len(signers)   # eth_keys, on first use
+        self._chain = _rlp_int(chain_id)
+        self._gas = _rlp_int(gas)
+        self._to = [b"\x94" + bytes.fromhex(a[2:]) for a in addresses]
+        self._legacy_tail = b"\x80" + self._chain + b"\x80\x80"   # data, EIP-155 (chainId, 0, 0)
+
+    def _key(self, pos: int):
+        key = self._keys[pos]
+        if key is None:
+            key = self._keys[pos] = eth_keys.PrivateKey(bytes(self._signers[pos].key))
+        return key
+
+    def sign(self, from_pos: int, to_pos: int, nonce: int, value: int, fee_fields: Dict) -> bytes:
+        to = self._to[to_pos]
+        if "gasPrice" in fee_fields:
+            head = _rlp_int(nonce) + _rlp_int(fee_fields["gasPrice"]) + self._gas + to + _rlp_int(value)
+            sig = self._key(from_pos).sign_msg_hash(keccak(_rlp_list(head + self._legacy_tail)))
+            v = sig.v + 35 + 2 * self.chain_id
+            return _rlp_list(head + b"\x80" + _rlp_int(v) + _rlp_int(sig.r) + _rlp_int(sig.s))
+        body = (self._chain + _rlp_int(nonce)
+                + _rlp_int(fee_fields["maxPriorityFeePerGas"]) + _rlp_int(fee_fields["maxFeePerGas"])
+                + self._gas + to + _rlp_int(value) + b"\x80\xc0")
+        sig = self._key(from_pos).sign_msg_hash(keccak(b"\x02" + _rlp_list(body)))
+        return b"\x02" + _rlp_list(body + _rlp_int(sig.v) + _rlp_int(sig.r) + _rlp_int(sig.s))
+
+    def verify(self, tx_templates: List[Dict]) -> bool:
+        """True if sign() matches sign_tx byte for byte, for both fee styles."""
+        to_pos = len(tx_templates) - 1
+        for fee_fields in ({"type": 2, "maxFeePerGas": 3 * 10**9, "maxPriorityFeePerGas": 10**9},
+                           {"gasPrice": 2 * 10**9}):
+            ref = dict(tx_templates[to_pos], nonce=0x1234, value=10**15, **fee_fields)
+            try:
+                if self.sign(0, to_pos, 0x1234, 10**15, fee_fields) != sign_tx(self._signers[0], ref):
+                    return False
+            except Exception:
+                return False
+        return True
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class BatchRpc:
+    """
+    Raw JSON-RPC client for independent reads that w3 would issue serially.
+
+    call() returns one result per (method, params) pair, in order, or None
+    when the request failed; pass an *errors* list to receive each item's
+    JSON-RPC error object (None where it succeeded).  Calls go out as one batch on the keep-alive
+    session shared with the w3 provider.  A non-list reply disables
+    batching for the rest of the run; after that the calls are sent as
+    concurrent single requests via aiohttp + asyncio.gather, or None is
+    returned (aiohttp missing) so callers fall back to per-call w3 requests.
+    """
+
+    def __init__(self, rpc_url: str, session: requests.Session, timeout: float = 30):
+        self.url = rpc_url
+        self.timeout = timeout
+        self.session = session
+        self.supported = True
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._aio = None
+
+    def call(self, calls: List[Tuple[str, list]],
+             errors: Optional[List] = None) -> Optional[List]:
+        if not calls:
+            return []
+        if errors is None:
+            errors = []
+        errors[:] = [None] * len(calls)
+        if self.supported:
+            results = self._post_batch(calls, errors)
+            if results is not None or self.supported:
+                return results
+        return self._gather(calls, errors)
+
+    def request(self, method: str, params: list):
+        """Single plain JSON-RPC call; raises on transport or RPC error."""
+        payload = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
+        body = self._post(payload)
+        if body.get("error"):
+            raise RuntimeError(f"{method}: {body['error']}")
+        return body.get("result")
+
+    def close(self):
+        if self._aio is not None:
+            self._loop.run_until_complete(self._aio.close())
+        if self._loop is not None:
+            self._loop.close()
+        self.session.close()
+
+    def _post(self, payload):
+        resp = self.session.post(self.url, data=_json_dumps(payload),
+                                 headers=_JSON_HEADERS, timeout=self.timeout)
+        return _json_loads(resp.content)
+
+    def _post_batch(self, calls: List[Tuple[str, list]], errors: List) -> Optional[List]:
+        payload = [
+            {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+            for i, (method, params) in enumerate(calls)
+        ]
+        try:
+            body = self._post(payload)
+        except Exception:
+            return None
+        if not isinstance(body, list):
+            self.supported = False
+            return None
+
+        results: List = [None] * len(calls)
+        for item in body:
+            i = item.get("id") if isinstance(item, dict) else None
+            if isinstance(i, int) and 0 <= i < len(calls):
+                results[i] = item.get("result")
+                errors[i] = item.get("error")
+        return results
+
+    def _gather(self, calls: List[Tuple[str, list]], errors: List) -> Optional[List]:
+        if aiohttp is None:
+            return None
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        try:
+            bodies = self._loop.run_until_complete(self._rpc_all(calls))
+        except Exception:
+            return None
+        errors[:] = [body.get("error") for body in bodies]
+        return [body.get("result") for body in bodies]
+
+    async def _rpc_all(self, calls: List[Tuple[str, list]]) -> List:
+        # gather() must run inside self._loop, or its tasks land on another loop
+        return await asyncio.gather(*(self._rpc(method, params) for method, params in calls))
+
+    async def _rpc(self, method: str, params: list):
+        if self._aio is None:
+            # Created lazily so it binds to self._loop.
+            self._aio = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        payload = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
+        async with self._aio.post(self.url, json=payload) as resp:
+            return _json_loads(await resp.read())
+
+
+def _batch_quantities(batch: BatchRpc, calls: List[Tuple[str, list]]) -> Optional[List[int]]:
+    """Hex-quantity results of *calls* as ints, or None if any call failed."""
+    results = batch.call(calls)
+    if results is None or None in results:
+        return None
+    return [int(r, 16) for r in results]
+
+
+def fetch_balances(w3: Web3, batch: BatchRpc, addresses: List[str]) -> List[int]:
+    """Latest balance of each address, in order, in a single round of requests."""
+    out = _batch_quantities(batch, [("eth_getBalance", [a, "latest"]) for a in addresses])
+    if out is not None:
+        return out
+    return [w3.eth.get_balance(a) for a in addresses]
+
+
+def fetch_nonces(w3: Web3, batch: BatchRpc, addresses: List[str]) -> List[int]:
+    """Pending nonce of each address, in order, in a single round of requests."""
+    out = _batch_quantities(batch, [("eth_getTransactionCount", [a, "pending"]) for a in addresses])
+    if out is not None:
+        return out
+    return [w3.eth.get_transaction_count(a, "pending") for a in addresses]
+
+
+def fetch_account_state(w3: Web3, batch: BatchRpc,
+                        addresses: List[str]) -> Tuple[List[int], List[int]]:
+    """(balances, pending nonces) of every address, in order, in one batch."""
+    n = len(addresses)
+    calls = [("eth_getBalance", [a, "latest"]) for a in addresses]
+    calls += [("eth_getTransactionCount", [a, "pending"]) for a in addresses]
+    out = _batch_quantities(batch, calls)
+    if out is not None:
+        return out[:n], out[n:]
+    return fetch_balances(w3, batch, addresses), fetch_nonces(w3, batch, addresses)
+
+
+# Multicall3 is deployed at the same address on most EVM chains.
+MULTICALL3 = "0xcA11bde05977b3631167028862bE2a173976CA11"
+_AGGREGATE3 = bytes.fromhex("82ad56cb")       # aggregate3((address,bool,bytes)[])
+_GET_ETH_BALANCE = bytes.fromhex("4d2301cc")  # getEthBalance(address)
+
+
+def _word(x: int) -> bytes:
+    return x.to_bytes(32, "big")
+
+
+def _encode_get_eth_balances(addresses: List[str]) -> str:
+    """aggregate3 calldata with one getEthBalance(addr) call per address."""
+    n = len(addresses)
+    target = bytes(12) + bytes.fromhex(MULTICALL3[2:])
+    heads, tails = [], []
+    for i, addr in enumerate(addresses):
+        call = _GET_ETH_BALANCE + bytes(12) + bytes.fromhex(addr[2:])
+        # Call3 = (target, allowFailure=false, callData): 3 head words,
+        # then callData length + 36 bytes padded to 64 → 192 bytes each.
+        heads.append(_word(n * 32 + i * 192))
+        tails.append(target + _word(0) + _word(96) + _word(len(call)) + call.ljust(64, b"\0"))
+    return "0x" + (_AGGREGATE3 + _word(32) + _word(n) + b"".join(heads + tails)).hex()
+
+
+def _decode_balances(raw: bytes, n: int) -> Optional[List[int]]:
+    """Decode aggregate3's (bool, bytes)[] result into n balances."""
+    def word(pos: int) -> int:
+        return int.from_bytes(raw[pos:pos + 32], "big")
+
+    try:
+        arr = word(0)
+        if len(raw) < 64 or word(arr) != n:
+            return None
+        base = arr + 32
+        out = []
+        for i in range(n):
+            t = base + word(base + 32 * i)
+            d = t + word(t + 32)
+            if not word(t) or word(d) != 32:
+                return None
+            out.append(word(d + 32))
+        return out
+    except Exception:
+        return None
+
+
+class BalanceReader:
+    """
+    Reads every account's balance in one round trip.
+
+    Uses a single eth_call to Multicall3 (calldata built once for the fixed
+    address list), sent raw: w3.eth.call re-queries eth_chainId each time
+    on some web3 versions, which would undo the saving.  The first failure
+    or empty reply — no Multicall3 on this chain — switches to
+    fetch_balances for the rest of the run.
+
+    known() serves a per-block snapshot: re-read when the block advances
+    or after release(), and debit()ed locally for sends in between.  Debits
+    stay held against the account until release() — the tx mined or its
+    send failed — so a re-read "latest" balance does not count unmined
+    sends as spendable again.
+    """
+
+    def __init__(self, w3: Web3, batch: BatchRpc, addresses: List[str]):
+        self.w3 = w3
+        self.batch = batch
+        self.addresses = addresses
+        self.multicall = True
+        self._call = {"to": MULTICALL3, "data": _encode_get_eth_balances(addresses)}
+        self._known: Optional[List[int]] = None
+        self._known_block = -1
+        self._inflight = [0] * len(addresses)
+
+    def fetch(self) -> List[int]:
+        if self.multicall:
+            try:
+                result = self.batch.request("eth_call", [self._call, "latest"])
+                balances = _decode_balances(bytes.fromhex(result[2:]), len(self.addresses))
+            except Exception:
+                balances = None
+            if balances is not None:
+                return balances
+            self.multicall = False
+        return fetch_balances(self.w3, self.batch, self.addresses)
+
+    def known(self, block: int) -> List[int]:
+        if self._known is None or block != self._known_block:
+            self._known = [b - d for b, d in zip(self.fetch(), self._inflight)]
+            self._known_block = block
+        return self._known
+
+    def debit(self, pos: int, wei: int):
+        self._inflight[pos] += wei
+        if self._known is not None:
+            self._known[pos] -= wei
+
+    def release(self, pos: int, wei: int):
+        """Stop holding a debit; the next known() re-reads the chain."""
+        self._inflight[pos] -= wei
+        self._known = None
+
+
+def poll_receipts(w3: Web3, batch: BatchRpc, hashes: List[str]) -> Dict[str, Dict]:
+    """
+    Returns {tx_hash: receipt} for the mined subset of *hashes*.
+    One batch round trip when supported, per-hash requests otherwise.
+    Hashes are 0x-prefixed hex, the form both paths put on the wire.
+    """
+    mined: Dict[str, Dict] = {}
+    if not hashes:
+        return mined
+
+    results = batch.call([("eth_getTransactionReceipt", [h]) for h in hashes])
+    if results is not None:
+        for h, r in zip(hashes, results):
+            if r:
+                # Raw batch receipts carry hex quantities; match w3's ints.
+                mined[h] = {
+                    k: (int(r[k], 16) if r.get(k) is not None else None)
+                    for k in ("blockNumber", "status", "gasUsed")
+                }
+        return mined
+
+    for h in hashes:
+        try:
+            r = w3.eth.get_transaction_receipt(h)
+        except Exception:
+            r = None
+        if r is not None:
+            mined[h] = r
+    return mined
+
+
+# Most blocks one eth_getBlockReceipts scan covers; older ones in a larger
+# gap are left to the per-hash straggler poll.
+BLOCK_SCAN_MAX = 32
+
+
+def _method_not_found(error) -> bool:
+    """True for a JSON-RPC error meaning the node does not serve the method."""
+    if not isinstance(error, dict):
+        return False
+    if error.get("code") == -32601:
+        return True
+    message = str(error.get("message", "")).lower()
+    return "method" in message and any(
+        s in message for s in ("not found", "not exist", "not available", "not supported"))
+
+
+class BlockReceiptScanner:
+    """
+    Finds mined txs by fetching whole blocks' receipts — one
+    eth_getBlockReceipts per new block, all in one batch — instead of
+    polling every pending hash.  Receipts only appear with a block, so
+    between blocks nothing needs polling at all.
+
+    A node that answers method-not-found (not every client serves it)
+    disables the scanner for the run.  Any other failure — including a
+    null result for a block this node has not imported yet, e.g. when the
+    --ws head comes from a faster node — just falls back to per-hash
+    polling for that tick.
+    """
+
+    def __init__(self, batch: BatchRpc):
+        self.batch = batch
+        self.enabled = True
+
+    def _unavailable(self, results: Optional[List], errors: List) -> bool:
+        """Disable the scanner if the node cannot serve eth_getBlockReceipts."""
+        if results is None and not self.batch.supported and aiohttp is None:
+            self.enabled = False    # no way left to send the calls
+        elif any(_method_not_found(e) for e in errors):
+            self.enabled = False
+        return not self.enabled
+
+    def scan(self, first: int, last: int) -> Optional[Dict[str, Dict]]:
+        """{tx_hash: receipt} for blocks first..last, or None on failure."""
+        first = max(first, last - BLOCK_SCAN_MAX + 1)
+        errors: List = []
+        results = self.batch.call(
+            [("eth_getBlockReceipts", [hex(b)]) for b in range(first, last + 1)], errors)
+        if self._unavailable(results, errors) or results is None or None in results:
+            return None
+        return self._index(results)
+
+    def head_with_next(self, block: int) -> Tuple[Optional[Tuple[int, Optional[int]]],
+                                                    Optional[Dict[str, Dict]]]:
+        """
+        The latest (number, baseFee), plus the receipts of `block` when that
+        is the head, in one batch — the usual one-block step costs no
+        separate scan.  (None, None) if the batch failed.
+        """
+        errors: List = []
+        results = self.batch.call([("eth_getBlockByNumber", ["latest", False]),
+                                   ("eth_getBlockReceipts", [hex(block)])], errors)
+        self._unavailable(results, errors[1:])
+        if not results or results[0] is None:
+            return None, None
+        latest = results[0]
+        number = int(latest["number"], 16)
+        base_fee = latest.get("baseFeePerGas")
+        head = (number, int(base_fee, 16) if base_fee is not None else None)
+        if number != block or results[1] is None:
+            return head, None
+        return head, self._index(results[1:])
+
+    @staticmethod
+    def _index(results: List[List[Dict]]) -> Dict[str, Dict]:
+        found: Dict[str, Dict] = {}
+        for receipts in results:
+            for r in receipts:
+                found[r["transactionHash"].lower()] = {
+                    k: (int(r[k], 16) if r.get(k) is not None else None)
+                    for k in ("blockNumber", "status", "gasUsed")
+                }
+        return found
+
+
+class HeadWatcher(threading.Thread):
+    """
+    Follows the chain head over a WebSocket eth_subscribe("newHeads").
+
+    head() is the latest (number, baseFeePerGas) while *connected*; the
+    main loop falls back to fetching the latest block over HTTP otherwise.
+    Reconnects with backoff.  Status lines go through *log*, which main()
+    points at its loop output buffer so they stay in order with it.
+    """
+
+    def __init__(self, ws_url: str):
+        super().__init__(daemon=True)
+        self.url = ws_url
+        self.latest: Optional[Tuple[int, Optional[int]]] = None
+        self.connected = False
+        self._new = threading.Event()
+        self.log = print
+
+    def run(self):
+        backoff = 1.0
+        while True:
+            try:
+                with ws_connect(self.url, open_timeout=10) as ws:
+                    ws.send(json.dumps({
+                        "jsonrpc": "2.0", "id": 1,
+                        "method": "eth_subscribe", "params": ["newHeads"],
+                    }))
+                    reply = _json_loads(ws.recv())
+                    if reply.get("error"):
+                        raise RuntimeError(reply["error"])
+                    self.connected = True
+                    backoff = 1.0
+                    for msg in ws:
+                        head = (_json_loads(msg).get("params") or {}).get("result") or {}
+                        if head.get("number"):
+                            base_fee = head.get("baseFeePerGas")
+                            self.latest = (
+                                int(head["number"], 16),
+                                int(base_fee, 16) if base_fee else None,
+                            )
+                            self._new.set()
+            except Exception as e:
+                self.log(f"[WS] newHeads unavailable ({e}); polling over HTTP")
+            self.connected = False
+            time.sleep(backoff)
+            backoff = min(backoff * 2, 30.0)
+
+    def head(self) -> Optional[Tuple[int, Optional[int]]]:
+        return self.latest if self.connected else None
+
+    def wait(self, timeout: float):
+        """Sleep up to *timeout*, waking early when a new head arrives."""
+        self._new.wait(timeout)
+        self._new.clear()
 
 
 # ══════════════════════════════════════════════════════════════════════
 # Account sourcing
 # ══════════════════════════════════════════════════════════════════════
 
+HD_PARENT_PATH = "m/44'/60'/0'/0"
+_SECP256K1_N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+
+
+def derive_hd_keys(mnemonic: str, indices: List[int]) -> List[bytes]:
+    """
+    Private keys at HD_PARENT_PATH/{idx} for each index.
+
+    The BIP-39 seed (2048 PBKDF2 rounds) and the parent node are derived
+    once.  Each index is then a non-hardened BIP-32 child step: one
+    HMAC-SHA512 over the parent's public point, which is computed once
+    (derive_child_key would redo that EC multiply per index).  Falls back
+    to Account.from_mnemonic per index if eth_account's hdaccount
+    internals are not the expected shape.
+    """
+    try:
+        from eth_account.hdaccount import seed_from_mnemonic
+        from eth_account.hdaccount.deterministic import HDPath, SoftNode, derive_child_key
+        from eth_keys import keys
+
+        seed = seed_from_mnemonic(mnemonic, "")
+        master = hmac.new(b"Bitcoin seed", seed, hashlib.sha512).digest()
+        key, chain_code = master[:32], master[32:]
+        for node in HDPath(HD_PARENT_PATH)._path:
+            key, chain_code = derive_child_key(key, chain_code, node)
+
+        parent_point = keys.PrivateKey(key).public_key.to_compressed_bytes()
+        parent_int = int.from_bytes(key, "big")
+        out = []
+        for idx in indices:
+            node = SoftNode(idx)
+            digest = hmac.new(chain_code, parent_point + node.serialize(), hashlib.sha512).digest()
+            tweak = int.from_bytes(digest[:32], "big")
+            child = (tweak + parent_int) % _SECP256K1_N
+            if tweak >= _SECP256K1_N or child == 0:
+                # Invalid child (p < 2**-127); BIP-32 retry rule lives there
+                out.append(derive_child_key(key, chain_code, node)[0])
+            else:
+                out.append(child.to_bytes(32, "big"))
+        return out
+    except (ImportError, AttributeError, TypeError):
+        return [
+            bytes(Account.from_mnemonic(mnemonic, account_path=f"{HD_PARENT_PATH}/{idx}").key)
+            for idx in indices
+        ]
+
+
 def load_accounts(args) -> List[Tuple[str, object]]:
     """
     Build accounts list from mnemonic and/or private keys.
@@ -161,10 +819,8 @@ def load_accounts(args) -> List[Tuple[str, object]]:
         else:
             indices = [0, 1, 2]
 
-        for idx in indices:
-            path = f"m/44'/60'/0'/0/{idx}"
-            acct = Account.from_mnemonic(mnemonic, account_path=path)
-            accounts.append((f"hd/{idx}", acct))
+        for idx, key in zip(indices, derive_hd_keys(mnemonic, indices)):
+            accounts.append((f"hd/{idx}", Account.from_key(key)))
 
     # ── Inline private keys ──
     if args.private_keys:
@@ -203,6 +859,34 @@ def load_accounts(args) -> List[Tuple[str, object]]:
 SENDER_MODES = ["round-robin", "single", "weighted", "multi-hot", "random"]
 
 
+def _build_alias(weights: List[float]) -> Tuple[List[float], List[int]]:
+    """Vose alias table: O(1) weighted draws after an O(n) build.
+
+    Column *i* keeps itself with probability ``prob[i]`` and otherwise
+    yields ``alias[i]``.
+    """
+    n = len(weights)
+    total = sum(weights)
+    scaled = [w * n / total for w in weights]
+    prob = [1.0] * n
+    alias = list(range(n))
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        s, l = small.pop(), large.pop()
+        prob[s] = scaled[s]
+        alias[s] = l
+        scaled[l] -= 1.0 - scaled[s]
+        (small if scaled[l] < 1.0 else large).append(l)
+    # Leftovers are 1.0 up to float error; they keep the default prob/alias.
+    return prob, alias
+
+
+# Random-mode sender draws are made this many at a time and served from a
+# buffer, so the per-call cost is a list pop rather than a Python-level draw.
+SENDER_DRAW_BATCH = 256
+
+
 class SenderSelector:
     """
     round-robin  — A0, A1, A2, … rotate each tx (default)
@@ -212,14 +896,23 @@ class SenderSelector:
     random       — sender picked uniformly at random
     """
 
+    __slots__ = ("mode", "n", "next", "_cursor", "_single_pos", "_hot_count", "_order",
+                 "_hot", "_weights", "_prob", "_alias", "_buf")
+
     def __init__(self, mode: str, n: int, **kw):
         self.mode = mode
         self.n = n
         self._cursor = 0
         self._single_pos = kw.get("single_pos", 0) % n
         self._hot_count = min(kw.get("hot_count", 1), n)
+        # Eligible positions for round-robin / random and for multi-hot
+        self._order = list(range(n))
+        self._hot = list(range(self._hot_count))
+        self._buf: List[int] = []   # pre-drawn positions for the random modes
 
         self._weights = kw.get("weights")
+        if not self._weights and mode == "weighted":
+            self._weights = [1.0] * n    # no --sender-weights: uniform draw
         if self._weights:
             # Pad or truncate to match account count
             if len(self._weights) < n:
@@ -228,29 +921,59 @@ class SenderSelector:
                 self._weights = self._weights[:n]
             if sum(self._weights) == 0:
                 raise SystemExit("ERROR: --sender-weights sum to zero.")
+            self._prob, self._alias = _build_alias(self._weights)
 
-    def next(self, exclude: Optional[int] = None) -> int:
-        """Return next sender position.  *exclude* is skipped (e.g. hub in fan-in)."""
-        for _ in range(self.n * 2):
-            pos = self._pick()
-            if exclude is not None and pos == exclude and self.n > 1:
-                continue
-            return pos
-        return self._pick()
+        self._bind()
 
-    def _pick(self) -> int:
+    def _bind(self):
+        """next() -> sender position; the mode's handler is bound once."""
         if self.mode == "round-robin":
-            pos = self._cursor % self.n
-            self._cursor = (self._cursor + 1) % self.n
-            return pos
-        if self.mode == "single":
-            return self._single_pos
+            self.next = self._next_round_robin
+        elif self.mode == "single":
+            single_pos = self._single_pos
+            self.next = lambda: single_pos
+        else:
+            self.next = self._next_buffered
+
+    def with_excluded(self, pos: int) -> "SenderSelector":
+        """
+        Copy that never yields *pos* (e.g. the hub in fan-in), so next()
+        is a single draw instead of draw-and-retry.  A mode left with no
+        other candidate keeps *pos*, as single-sender mode always does.
+        """
+        sel = copy.copy(self)
+        sel._buf = []
+        sel._order = [i for i in self._order if i != pos] or self._order
+        sel._hot = [i for i in self._hot if i != pos] or self._hot
+        if self._weights:
+            weights = list(self._weights)
+            weights[pos] = 0.0
+            if sum(weights) > 0:
+                sel._weights = weights
+                sel._prob, sel._alias = _build_alias(weights)
+        sel._bind()   # the copied handler is still bound to self
+        return sel
+
+    def _next_round_robin(self) -> int:
+        pos = self._order[self._cursor]
+        self._cursor = (self._cursor + 1) % len(self._order)
+        return pos
+
+    def _next_buffered(self) -> int:
+        if not self._buf:
+            self._buf = self._draw(SENDER_DRAW_BATCH)
+        return self._buf.pop()
+
+    def _draw(self, k: int) -> List[int]:
+        """*k* independent draws for weighted / multi-hot / random, in one pass."""
+        rnd = random.random
         if self.mode == "weighted":
-            return random.choices(range(self.n), weights=self._weights, k=1)[0]
-        if self.mode == "multi-hot":
-            return random.randint(0, self._hot_count - 1)
-        # random
-        return random.randint(0, self.n - 1)
+            n, prob, alias = self.n, self._prob, self._alias
+            return [i if rnd() < prob[i] else alias[i]
+                    for i in [int(rnd() * n) for _ in range(k)]]
+        pool = self._hot if self.mode == "multi-hot" else self._order
+        m = len(pool)
+        return [pool[int(rnd() * m)] for _ in range(k)]
 
 
 # ══════════════════════════════════════════════════════════════════════
@@ -275,6 +998,10 @@ class RecipientSelector:
     bursty           — for T seconds target a random subset, then switch
     """
 
+    __slots__ = ("mode", "n", "next", "hub_pos", "partition_size", "campaign_duration",
+                 "campaign_subset", "_last_pair", "_fanout_pool", "_partition",
+                 "_campaign_pool", "_campaign_targets", "_campaign_switch")
+
     def __init__(self, mode: str, n: int, **kw):
         self.mode = mode
         self.n = n
@@ -284,9 +1011,27 @@ class RecipientSelector:
         self.campaign_subset: int = kw.get("campaign_subset") or max(2, n // 2)
 
         self._last_pair: Tuple[int, int] = (-1, -1)
+        # Recipient pools fixed by the topology, built once instead of per tx
+        self._fanout_pool = [i for i in range(n) if i != self.hub_pos]
+        self._partition: List[Tuple[int, int]] = []   # sender → (group start, group size)
+        if mode == "partitioned":
+            for pos in range(n):
+                g_start = (pos // self.partition_size) * self.partition_size
+                self._partition.append((g_start, min(self.partition_size, n - g_start)))
+        self._campaign_pool = list(range(n))   # permuted in place per campaign
         self._campaign_targets: Optional[List[int]] = None
         self._campaign_switch: float = 0.0
 
+        # next(sender_pos) -> recipient position; the mode's handler is bound once
+        if mode == "star-fan-in":
+            hub_pos = self.hub_pos
+            self.next = lambda sender_pos: hub_pos
+        elif mode in ("star-fan-out", "random-uniform", "random-no-repeat",
+                      "partitioned", "bursty"):
+            self.next = getattr(self, "_next_" + mode.replace("-", "_"))
+        else:
+            self.next = lambda sender_pos: (sender_pos + 1) % n   # ring
+
     # -- Sender interaction helpers --
 
     def overrides_sender(self) -> bool:
@@ -304,50 +1049,53 @@ class RecipientSelector:
 
     # -- Core --
 
-    def next(self, sender_pos: int) -> int:
-        if self.mode == "ring":
-            return (sender_pos + 1) % self.n
-
-        if self.mode == "star-fan-out":
-            others = [i for i in range(self.n) if i != self.hub_pos]
-            return random.choice(others) if others else 0
-
-        if self.mode == "star-fan-in":
-            return self.hub_pos
-
-        if self.mode == "random-uniform":
-            others = [i for i in range(self.n) if i != sender_pos]
-            return random.choice(others) if others else 0
-
-        if self.mode == "random-no-repeat":
-            others = [
-                i for i in range(self.n)
-                if i != sender_pos and (sender_pos, i) != self._last_pair
-            ]
-            if not others:
-                others = [i for i in range(self.n) if i != sender_pos]
-            chosen = random.choice(others) if others else 0
-            self._last_pair = (sender_pos, chosen)
-            return chosen
-
-        if self.mode == "partitioned":
-            g_start = (sender_pos // self.partition_size) * self.partition_size
-            g_end = min(g_start + self.partition_size, self.n)
-            others = [i for i in range(g_start, g_end) if i != sender_pos]
-            return random.choice(others) if others else sender_pos
-
-        if self.mode == "bursty":
-            now = time.time()
-            if self._campaign_targets is None or now >= self._campaign_switch:
-                pool = [i for i in range(self.n) if i != sender_pos]
-                k = min(self.campaign_subset, len(pool))
-                self._campaign_targets = random.sample(pool, k) if pool else [0]
-                self._campaign_switch = now + self.campaign_duration
-            candidates = [t for t in self._campaign_targets if t != sender_pos]
-            return random.choice(candidates) if candidates else self._campaign_targets[0]
-
-        # fallback: ring
-        return (sender_pos + 1) % self.n
+    def _other_than(self, pos: int) -> int:
+        """Uniform position != *pos*: draw from n-1 and shift past *pos*."""
+        if self.n < 2:
+            return 0
+        chosen = random.randrange(self.n - 1)
+        return chosen + (chosen >= pos)
+
+    def _next_star_fan_out(self, sender_pos: int) -> int:
+        return random.choice(self._fanout_pool) if self._fanout_pool else 0
+
+    def _next_random_uniform(self, sender_pos: int) -> int:
+        return self._other_than(sender_pos)
+
+    def _next_random_no_repeat(self, sender_pos: int) -> int:
+        chosen = self._other_than(sender_pos)
+        # Only one other account means the repeat is unavoidable
+        while (sender_pos, chosen) == self._last_pair and self.n > 2:
+            chosen = self._other_than(sender_pos)
+        self._last_pair = (sender_pos, chosen)
+        return chosen
+
+    def _next_partitioned(self, sender_pos: int) -> int:
+        g_start, g_size = self._partition[sender_pos]
+        if g_size < 2:
+            return sender_pos
+        # Draw from the group minus the sender by shifting past its slot
+        chosen = g_start + random.randrange(g_size - 1)
+        return chosen + (chosen >= sender_pos)
+
+    def _next_bursty(self, sender_pos: int) -> int:
+        now = time.monotonic()
+        if self._campaign_targets is None or now >= self._campaign_switch:
+            # Partial Fisher-Yates: k+1 draws so the sender can be dropped
+            pool = self._campaign_pool
+            k = min(self.campaign_subset, self.n - 1)
+            for i in range(min(k + 1, self.n)):
+                j = random.randrange(i, self.n)
+                pool[i], pool[j] = pool[j], pool[i]
+            targets = [t for t in pool[:k + 1] if t != sender_pos][:k]
+            self._campaign_targets = targets or [0]
+            self._campaign_switch = now + self.campaign_duration
+        targets = self._campaign_targets
+        chosen = random.choice(targets)
+        # Later senders may be in the campaign; redraw rather than self-send
+        while chosen == sender_pos and len(targets) > 1:
+            chosen = random.choice(targets)
+        return chosen
 
 
 # ══════════════════════════════════════════════════════════════════════
@@ -366,6 +1114,10 @@ class AmountSelector:
     balance-aware  — send half of (balance - reserve), clamped to [min, max]
     """
 
+    __slots__ = ("mode", "next", "fixed_wei", "min_wei", "max_wei", "log_sigma", "step_amounts",
+                 "step_duration", "reserve_wei", "_start", "_lo_wei", "_hi_wei",
+                 "_median_wei")
+
     def __init__(self, mode: str, **kw):
         self.mode = mode
         self.fixed_wei: int = kw.get("fixed_wei", 0)
@@ -375,55 +1127,55 @@ class AmountSelector:
         self.step_amounts: List[int] = kw.get("step_amounts", [])
         self.step_duration: float = kw.get("step_duration", 60.0)
         self.reserve_wei: int = kw.get("reserve_wei", 0)
-        self._start = time.time()
+        self._start = time.monotonic()
+
+        # log-normal bounds in wei; the median maps to their geometric mean
+        self._lo_wei = max(self.min_wei, 1)
+        self._hi_wei = max(self.max_wei, self._lo_wei)
+        self._median_wei = math.isqrt(self._lo_wei * self._hi_wei)
 
-    def next(self, sender_balance_wei: int = 0) -> int:
-        if self.mode == "fixed":
+        # next(sender_balance_wei=0) -> amount in wei; the mode's handler is bound once
+        if mode in ("uniform-random", "log-normal", "step-schedule", "balance-aware"):
+            self.next = getattr(self, "_next_" + mode.replace("-", "_"))
+        else:
+            fixed_wei = self.fixed_wei
+            self.next = lambda sender_balance_wei=0: fixed_wei
+
+    def _next_uniform_random(self, sender_balance_wei: int = 0) -> int:
+        return random.randint(self.min_wei, max(self.min_wei, self.max_wei))
+
+    def _next_log_normal(self, sender_balance_wei: int = 0) -> int:
+        amount = int(random.lognormvariate(0, self.log_sigma) * self._median_wei)
+        return max(self._lo_wei, min(self._hi_wei, amount))
+
+    def _next_step_schedule(self, sender_balance_wei: int = 0) -> int:
+        if not self.step_amounts:
             return self.fixed_wei
+        elapsed = time.monotonic() - self._start
+        idx = int(elapsed / self.step_duration) % len(self.step_amounts)
+        return self.step_amounts[idx]
 
-        if self.mode == "uniform-random":
-            lo = self.min_wei
-            hi = max(self.min_wei, self.max_wei)
-            return random.randint(lo, hi)
-
-        if self.mode == "log-normal":
-            # Median of the lognormal maps to geometric mean of [min, max].
-            lo_eth = max(Decimal(self.min_wei) / Decimal(10**18), Decimal("1e-18"))
-            hi_eth = max(Decimal(self.max_wei) / Decimal(10**18), lo_eth)
-            median_eth = float((lo_eth * hi_eth).sqrt())
-            raw = random.lognormvariate(0, self.log_sigma)
-            amount_eth = raw * median_eth
-            amount_eth = max(float(lo_eth), min(float(hi_eth), amount_eth))
-            return int(Decimal(str(amount_eth)) * Decimal(10**18))
-
-        if self.mode == "step-schedule":
-            if not self.step_amounts:
-                return self.fixed_wei
-            elapsed = time.time() - self._start
-            idx = int(elapsed / self.step_duration) % len(self.step_amounts)
-            return self.step_amounts[idx]
-
-        if self.mode == "balance-aware":
-            available = max(0, sender_balance_wei - self.reserve_wei)
-            amount = available // 2
-            if self.max_wei > 0:
-                amount = min(amount, self.max_wei)
-            amount = max(amount, self.min_wei)
-            return amount
-
-        return self.fixed_wei
+    def _next_balance_aware(self, sender_balance_wei: int = 0) -> int:
+        available = max(0, sender_balance_wei - self.reserve_wei)
+        amount = available // 2
+        if self.max_wei > 0:
+            amount = min(amount, self.max_wei)
+        amount = max(amount, self.min_wei)
+        return amount
 
 
 # ══════════════════════════════════════════════════════════════════════
 # 4) Timing / rate distribution
 # ══════════════════════════════════════════════════════════════════════
 
+_NS = 1_000_000_000
+
 TIMING_MODES = ["per-block", "fixed-tps", "poisson", "bursts", "ramp", "jittered"]
 
 
 class TimingController:
     """
-    per-block  — one tx per new block  (default)
+    per-block  — one tx (or --txs-per-block) per new block  (default)
     fixed-tps  — constant transactions per second
     poisson    — exponential inter-arrival times (average = target TPS)
     bursts     — send N rapidly, pause, repeat
@@ -431,8 +1183,14 @@ class TimingController:
     jittered   — base interval +/- random uniform jitter
     """
 
+    __slots__ = ("mode", "per_block", "tps", "burst_size", "burst_pause", "ramp_start",
+                 "ramp_end", "ramp_dur", "jitter_base", "jitter_range", "_now", "_start",
+                 "_last_send", "_last_block", "_block_sends", "_next_send", "_burst_rem",
+                 "_burst_pause_until", "_interval_ns", "_burst_pause_ns", "_ramp_dur_ns")
+
     def __init__(self, mode: str, **kw):
         self.mode = mode
+        self.per_block: int = max(1, kw.get("txs_per_block", 1))
         self.tps: float = kw.get("target_tps", 1.0)
         self.burst_size: int = kw.get("burst_size", 50)
         self.burst_pause: float = kw.get("burst_pause", 10.0)
@@ -442,30 +1200,35 @@ class TimingController:
         self.jitter_base: float = kw.get("jitter_base", 1.0)
         self.jitter_range: float = kw.get("jitter_range", 0.5)
 
-        self._start = time.time()
-        self._last_send = 0.0
+        # All schedule state is integer monotonic nanoseconds
+        self._now = time.monotonic_ns
+        self._start = self._now()
+        self._last_send = 0
         self._last_block = -1
-        self._next_send = 0.0
+        self._block_sends = 0
+        self._next_send = 0
         self._burst_rem = self.burst_size
-        self._burst_pause_until = 0.0
+        self._burst_pause_until = 0
+        self._interval_ns = int(_NS / self.tps) if self.tps > 0 else _NS
+        self._burst_pause_ns = int(self.burst_pause * _NS)
+        self._ramp_dur_ns = int(self.ramp_dur * _NS)
 
-        self._schedule_next()
+        self._schedule_next(self._start)
 
-    def _schedule_next(self):
-        now = time.time()
+    def _schedule_next(self, now: int):
         if self.mode == "fixed-tps":
-            self._next_send = now + (1.0 / self.tps if self.tps > 0 else 1.0)
+            self._next_send = now + self._interval_ns
         elif self.mode == "poisson":
-            self._next_send = now + (random.expovariate(self.tps) if self.tps > 0 else 1.0)
+            self._next_send = now + (int(random.expovariate(self.tps) * _NS) if self.tps > 0 else _NS)
         elif self.mode == "jittered":
             jitter = random.uniform(-self.jitter_range, self.jitter_range)
-            self._next_send = now + max(0.01, self.jitter_base + jitter)
+            self._next_send = now + int(max(0.01, self.jitter_base + jitter) * _NS)
 
     def should_send(self, current_block: int) -> bool:
-        now = time.time()
-
         if self.mode == "per-block":
-            return current_block > self._last_block
+            return current_block > self._last_block or self._block_sends < self.per_block
+
+        now = self._now()
 
         if self.mode in ("fixed-tps", "poisson", "jittered"):
             return now >= self._next_send
@@ -481,27 +1244,33 @@ class TimingController:
 
         if self.mode == "ramp":
             elapsed = now - self._start
-            progress = min(1.0, elapsed / self.ramp_dur) if self.ramp_dur > 0 else 1.0
+            progress = min(1.0, elapsed / self._ramp_dur_ns) if self._ramp_dur_ns > 0 else 1.0
             cur_tps = self.ramp_start + (self.ramp_end - self.ramp_start) * progress
-            interval = 1.0 / cur_tps if cur_tps > 0 else 1.0
+            interval = int(_NS / cur_tps) if cur_tps > 0 else _NS
             return (now - self._last_send) >= interval
 
         return True
 
     def record_send(self, current_block: int):
-        self._last_send = time.time()
+        now = self._now()
+        self._last_send = now
+        if current_block != self._last_block:
+            self._block_sends = 0
+        self._block_sends += 1
         self._last_block = current_block
 
         if self.mode == "bursts":
             self._burst_rem -= 1
             if self._burst_rem <= 0:
                 self._burst_rem = 0
-                self._burst_pause_until = time.time() + self.burst_pause
+                self._burst_pause_until = now + self._burst_pause_ns
         else:
-            self._schedule_next()
+            self._schedule_next(now)
 
     def in_burst(self) -> bool:
-        """True if mid-burst and should skip the poll-interval sleep."""
+        """True if mid-burst (or mid-block batch) and should skip the poll-interval sleep."""
+        if self.mode == "per-block":
+            return self._block_sends < self.per_block
         return self.mode == "bursts" and self._burst_rem > 0
 
 
@@ -509,56 +1278,73 @@ class TimingController:
 # Pending-tx tracker
 # ══════════════════════════════════════════════════════════════════════
 
+# Receipt re-check backoff between blocks (seconds); doubles per miss.
+RECEIPT_POLL_MIN = 0.5
+RECEIPT_POLL_MAX = 4.0
+
+# Loop wait floor (seconds) when blocks are fast; --poll-interval is the
+# ceiling.  Between them the wait tracks a quarter of the block time.
+POLL_INTERVAL_MIN = 0.05
+
+
 class PendingTx:
-    __slots__ = ("tx_hash", "kind", "sender", "to", "value_wei",
-                 "sent_at_block", "nonce", "sent_at_time")
+    __slots__ = ("tx_hash", "kind", "sender_pos", "to_pos", "value_wei",
+                 "sent_at_block", "nonce", "debit_wei", "sent_at_time",
+                 "next_poll_at", "poll_backoff")
 
-    def __init__(self, tx_hash, kind, sender, to, value_wei, sent_at_block, nonce):
+    def __init__(self, tx_hash, kind, sender_pos, to_pos, value_wei,
+                 sent_at_block, nonce, debit_wei):
         self.tx_hash = tx_hash
         self.kind = kind
-        self.sender = sender
-        self.to = to
+        self.sender_pos = sender_pos
+        self.to_pos = to_pos
         self.value_wei = value_wei
         self.sent_at_block = sent_at_block
         self.nonce = nonce
-        self.sent_at_time = time.time()
+        self.debit_wei = debit_wei
+        self.sent_at_time = time.monotonic()
+        self.poll_backoff = RECEIPT_POLL_MIN
+        self.next_poll_at = self.sent_at_time + RECEIPT_POLL_MIN
+
+    def due(self, now: float, new_block: bool) -> bool:
+        """Receipts can only appear with a block; otherwise wait out the backoff."""
+        return new_block or now >= self.next_poll_at
+
+    def missed(self, now: float):
+        self.next_poll_at = now + self.poll_backoff
+        self.poll_backoff = min(RECEIPT_POLL_MAX, self.poll_backoff * 2)
 
 
 # ══════════════════════════════════════════════════════════════════════
 # Top-up logic
 # ══════════════════════════════════════════════════════════════════════
 
-def choose_topup(w3, accounts, funder_pos, amount_hint_wei, reserve_wei,
-                 topup_target_wei, worst_fee_gas, gas_limit):
+def choose_topup(balances, funder_pos, amount_hint_wei, reserve_wei,
+                 topup_target_wei, worst_fee_gas, gas_limit, log=print):
     """
     If any non-funder account is below the minimum needed to operate,
     return (funder_pos, target_pos, topup_amount_wei), else None.
+    *balances* holds every account's balance, by position; *funder_pos*
+    is validated once in main().
     """
-    n = len(accounts)
-    if funder_pos >= n:
-        return None
-
     fee_buf = worst_fee_gas * gas_limit
-    needed_min = reserve_wei + amount_hint_wei + fee_buf
-
-    funder_addr = accounts[funder_pos][1].address
-    funder_bal = w3.eth.get_balance(funder_addr)
-
-    for pos in range(n):
-        if pos == funder_pos:
-            continue
-        bal = w3.eth.get_balance(accounts[pos][1].address)
-        if bal < needed_min and bal < topup_target_wei:
-            delta = topup_target_wei - bal
-            if funder_bal < (delta + fee_buf + reserve_wei):
-                print(
-                    f"  TOPUP wanted for [{pos}] but funder lacks balance "
-                    f"(funder={wei_to_eth(funder_bal)} ETH)."
-                )
-                return None
-            return (funder_pos, pos, delta)
+    # Below both the operating minimum and the target <=> below the smaller
+    threshold = min(reserve_wei + amount_hint_wei + fee_buf, topup_target_wei)
 
-    return None
+    pos = next((p for p, bal in enumerate(balances)
+                if bal < threshold and p != funder_pos), None)
+    if pos is None:
+        return None
+
+    funder_bal = balances[funder_pos]
+    delta = topup_target_wei - balances[pos]
+    if funder_bal < (delta + fee_buf + reserve_wei):
+        log(
+            f"  TOPUP wanted for [{pos}] but funder lacks balance "
+            f"(funder={fmt_eth(funder_bal)} ETH)."
+        )
+        return None
+    return (funder_pos, pos, delta)
 
 
 # ══════════════════════════════════════════════════════════════════════
@@ -575,6 +1361,8 @@ def build_parser():
     g = p.add_argument_group("Account sourcing")
     g.add_argument("--rpc", required=True,
                    help="RPC endpoint URL")
+    g.add_argument("--ws", default=None,
+                   help="WebSocket RPC URL for newHeads block notifications (optional)")
     g.add_argument("--mnemonic", default=None,
                    help="BIP-39 seed phrase (caution: visible in shell history)")
     g.add_argument("--prompt-mnemonic", action="store_true",
@@ -649,8 +1437,11 @@ def build_parser():
                    help="Base interval seconds for 'jittered' mode (default: 1.0)")
     g.add_argument("--jitter-range", type=float, default=0.5,
                    help="Plus/minus jitter range seconds (default: 0.5)")
+    g.add_argument("--txs-per-block", type=int, default=1,
+                   help="Txs to send per new block for 'per-block' timing (default: 1)")
     g.add_argument("--poll-interval", type=float, default=0.2,
-                   help="Loop sleep when idle (default: 0.2)")
+                   help="Max loop sleep when idle; shortened on chains with "
+                        "sub-second blocks (default: 0.2)")
 
     # — Fee / gas —
     g = p.add_argument_group("Fee / gas")
@@ -691,16 +1482,35 @@ def main():
 
     if n < 2:
         raise SystemExit("ERROR: need at least 2 accounts.")
+    if args.topup_enabled and not 0 <= args.topup_funder_pos < n:
+        raise SystemExit(f"ERROR: --topup-funder-pos {args.topup_funder_pos} is out of range (0..{n - 1}).")
 
     # ── Connect ──
-    w3 = setup_web3(args.rpc)
+    # At most one send per sender is in flight, so more workers than
+    # accounts would sit idle.
+    send_workers = max(1, min(args.max_inflight, n))
+    session = make_rpc_session(max(RPC_POOL_SIZE, send_workers + 1))
+    w3 = setup_web3(args.rpc, session)
+    batch = BatchRpc(args.rpc, session)
+    heads = None
+    if args.ws:
+        if ws_connect is None:
+            raise SystemExit("ERROR: --ws needs the 'websockets' package (pip install websockets).")
+        heads = HeadWatcher(args.ws)
+        heads.start()
+    idle = heads.wait if heads else time.sleep
     chain_id = int(w3.eth.chain_id)
 
     print(f"\nConnected: {args.rpc}  chainId={chain_id}")
     print(f"Accounts ({n}):")
-    for pos, (label, acct) in enumerate(accounts):
-        bal = w3.eth.get_balance(acct.address)
-        print(f"  [{pos}] {label:>8s}  {acct.address}  bal={wei_to_eth(bal)} ETH")
+    # Parallel per-position lists: the hot path indexes these directly
+    signers = [acct for _, acct in accounts]
+    addresses = [acct.address for acct in signers]
+    short_addrs = [f"{a[:10]}.." for a in addresses]   # log-line form
+    balance_reader = BalanceReader(w3, batch, addresses)
+    start_balances, start_nonces = fetch_account_state(w3, batch, addresses)
+    for pos, ((label, _), addr, bal) in enumerate(zip(accounts, addresses, start_balances)):
+        print(f"  [{pos}] {label:>8s}  {addr}  bal={fmt_eth(bal)} ETH")
 
     # ── Parse numeric params ──
     amount_eth = Decimal(args.amount_eth)
@@ -728,6 +1538,17 @@ def main():
 
     gas_limit = 21_000
 
+    # Per-recipient constant tx fields; only nonce / value / fees vary per send
+    tx_templates = [
+        {"chainId": chain_id, "to": addr, "gas": gas_limit} for addr in addresses
+    ]
+
+    # Direct RLP signing for these fixed-shape transfers, once proven identical
+    template_signer: Optional[TemplateSigner] = TemplateSigner(chain_id, gas_limit, signers, addresses)
+    if not template_signer.verify(tx_templates):
+        print("[WARN] template signer disagrees with eth_account; using sign_transaction.")
+        template_signer = None
+
     # ── Build selectors ──
     sender_sel = SenderSelector(
         args.sender_mode, n,
@@ -743,6 +1564,8 @@ def main():
         campaign_duration=args.campaign_duration,
         campaign_subset=args.campaign_subset,
     )
+    if recip_sel.sender_exclude() is not None:
+        sender_sel = sender_sel.with_excluded(recip_sel.sender_exclude())
 
     amount_sel = AmountSelector(
         args.amount_mode,
@@ -765,15 +1588,63 @@ def main():
         ramp_duration=args.ramp_duration,
         jitter_base=args.jitter_base,
         jitter_range=args.jitter_range,
+        txs_per_block=args.txs_per_block,
     )
 
     # ── State ──
-    nonces: Dict[str, int] = {}
-    for _, acct in accounts:
-        nonces[acct.address] = w3.eth.get_transaction_count(acct.address, "pending")
+    nonces: List[int] = start_nonces
 
     pending: Dict[str, PendingTx] = {}
+    # Sends run on their own workers so several overlap one RTT; at most
+    # one per sender is in flight, which keeps each sender's nonces in order.
+    send_pool = ThreadPoolExecutor(max_workers=send_workers)
+    sending: Dict[str, Future] = {}       # tx_hash → send_raw_transaction future
+    sender_send: List[Optional[Future]] = [None] * n   # each sender's latest send
+
+    # Loop output is collected per iteration and written in one call
+    log_lines: List[str] = []
+    log = log_lines.append
+    if heads:
+        heads.log = log
+
+    def flush_log():
+        # Slice, then delete only what was written: the head watcher
+        # thread may append in between
+        lines = log_lines[:]
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
+            del log_lines[:len(lines)]
+
+    def settle_sends():
+        """Drop finished sends; roll a failed one's nonce back for a re-send."""
+        for h, fut in list(sending.items()):
+            if not fut.done():
+                continue
+            del sending[h]
+            err = fut.exception()
+            if err is None or h not in pending:
+                # A block scan can report the tx mined while its POST was
+                # still out; the nonce is used, so a late error changes nothing
+                continue
+            reason = str(err).lower()
+            if "already known" in reason or "known transaction" in reason:
+                continue    # the node has it already (e.g. a retried POST)
+            meta = pending.pop(h)
+            log(f"[ERROR] send failed: {err}")
+            nonces[meta.sender_pos] = meta.nonce
+            if "nonce too low" in reason:
+                # Local count drifted (external send, reorg): re-read this
+                # one account rather than re-sending a used nonce forever
+                try:
+                    nonces[meta.sender_pos] = int(batch.request(
+                        "eth_getTransactionCount", [addresses[meta.sender_pos], "pending"]), 16)
+                except Exception:
+                    pass
+            balance_reader.release(meta.sender_pos, meta.debit_wei)
     last_seen_block = w3.eth.block_number
+    scanner = BlockReceiptScanner(batch)
+    fee_cache = FeeCache(w3, args.tip_wei, args.max_fee_multiplier)
 
     # ── Banner ──
     print(f"\nDistribution:")
@@ -788,46 +1659,111 @@ def main():
     print(f"\nLoop starting. Ctrl+C to stop.\n")
 
     # ── Main loop ──
+    # Each iteration owns one poll interval measured from its start; the
+    # wait at the top sleeps only what the previous iteration's RPCs left.
+    deadline = 0.0
+    poll_interval = args.poll_interval
+    block_time = None                    # EMA of seconds per block
+    block_seen_at = None
     try:
         while True:
-            current_block = w3.eth.block_number
-            if current_block != last_seen_block:
+            flush_log()
+            remaining = deadline - time.monotonic()
+            if remaining > 0:
+                idle(remaining)
+            deadline = time.monotonic() + poll_interval
+
+            # One header gives both the block number and its baseFee
+            head = heads.head() if heads else None
+            next_receipts = None
+            if head is None and scanner.enabled and pending and batch.supported:
+                head, next_receipts = scanner.head_with_next(last_seen_block + 1)
+            if head is None:
+                latest = w3.eth.get_block("latest", full_transactions=False)
+                head = (latest["number"], latest.get("baseFeePerGas"))
+            current_block, base_fee = head
+            new_block = current_block != last_seen_block
+            prev_block = last_seen_block
+            if new_block:
                 last_seen_block = current_block
-
-            # ── Poll receipts ──
-            done = []
-            for h, meta in pending.items():
-                try:
-                    r = w3.eth.get_transaction_receipt(h)
-                except Exception:
-                    r = None
-                if r is not None:
-                    mb = r.get("blockNumber")
-                    st = r.get("status")
-                    gu = r.get("gasUsed")
-                    db = (mb - meta.sent_at_block) if mb is not None else None
-                    print(
-                        f"[MINED] kind={meta.kind} hash={h[:10]}.. "
-                        f"{meta.sender[:10]}..→{meta.to[:10]}.. "
-                        f"val={wei_to_eth(meta.value_wei)} sent@{meta.sent_at_block} "
-                        f"mined@{mb} Δ={db} status={st} gas={gu}"
-                    )
-                    done.append(h)
-            for h in done:
-                pending.pop(h, None)
+                t = time.monotonic()
+                if block_seen_at is not None and current_block > prev_block:
+                    dt = (t - block_seen_at) / (current_block - prev_block)
+                    block_time = dt if block_time is None else 0.9 * block_time + 0.1 * dt
+                    poll_interval = min(args.poll_interval,
+                                        max(POLL_INTERVAL_MIN, block_time / 4))
+                block_seen_at = t
+
+            settle_sends()
+
+            # ── Collect receipts: scan new blocks, else one batch of due hashes ──
+            now = time.monotonic()
+            mined: Dict[str, Dict] = {}
+            scanned = False
+            if scanner.enabled and new_block and pending:
+                found = next_receipts
+                if found is None:
+                    found = scanner.scan(prev_block + 1, current_block)
+                if found is not None:
+                    mined = {h: found[h] for h in pending if h in found}
+                    scanned = True
+            # pending is in send order, so sent_at_block only grows along it:
+            # stop at the first tx too young to poll.  A tx sent at head N
+            # can be mined in N+1 at the earliest.  It is also each sender's
+            # nonce order, and a sender's txs mine in nonce order: outside
+            # the new-block poll, whose answers are all fresh, only each
+            # sender's oldest unmined tx is worth re-polling.
+            due = []
+            fronts = set()
+            if scanner.enabled and (scanned or not new_block):
+                # Scans cover every block; poll per hash only for stragglers
+                # (reorged out, or beyond BLOCK_SCAN_MAX) a few blocks old
+                for h, m in pending.items():
+                    if m.sent_at_block + 2 >= current_block:
+                        break
+                    if h in mined or m.sender_pos in fronts:
+                        continue
+                    fronts.add(m.sender_pos)
+                    if h not in sending and m.due(now, False):
+                        due.append(h)
+            else:
+                for h, m in pending.items():
+                    if m.sent_at_block >= current_block:
+                        break
+                    if not new_block:
+                        if m.sender_pos in fronts:
+                            continue
+                        fronts.add(m.sender_pos)
+                    if h not in sending and m.due(now, new_block):
+                        due.append(h)
+            mined.update(poll_receipts(w3, batch, due))
+            for h in due:
+                if h not in mined:
+                    pending[h].missed(now)
+            for h, r in mined.items():
+                meta = pending.pop(h)
+                balance_reader.release(meta.sender_pos, meta.debit_wei)
+                mb = r.get("blockNumber")
+                st = r.get("status")
+                gu = r.get("gasUsed")
+                db = (mb - meta.sent_at_block) if mb is not None else None
+                log(
+                    f"[MINED] kind={meta.kind} hash={h[:10]}.. "
+                    f"{short_addrs[meta.sender_pos]}→{short_addrs[meta.to_pos]} "
+                    f"val={fmt_eth(meta.value_wei)} sent@{meta.sent_at_block} "
+                    f"mined@{mb} Δ={db} status={st} gas={gu}"
+                )
 
             # ── Inflight cap ──
             if len(pending) >= args.max_inflight:
-                time.sleep(args.poll_interval)
                 continue
 
             # ── Timing gate ──
             if not timing.should_send(current_block):
-                time.sleep(args.poll_interval)
                 continue
 
-            # ── Fee fields (fresh each send — baseFee can change) ──
-            fee_fields, worst_fee_gas = get_fee_fields(w3, args.tip_wei, args.max_fee_multiplier)
+            # ── Fee fields (baseFee / gasPrice only move between blocks) ──
+            fee_fields, worst_fee_gas = fee_cache.get(current_block, base_fee)
             fee_buf = worst_fee_gas * gas_limit
 
             # ── Choose action ──
@@ -836,8 +1772,8 @@ def main():
             # Top-up takes priority
             if args.topup_enabled:
                 tu = choose_topup(
-                    w3, accounts, args.topup_funder_pos, amount_wei,
-                    reserve_wei, topup_target_wei, worst_fee_gas, gas_limit,
+                    balance_reader.known(current_block), args.topup_funder_pos, amount_wei,
+                    reserve_wei, topup_target_wei, worst_fee_gas, gas_limit, log,
                 )
                 if tu:
                     action = ("topup", tu[0], tu[1], tu[2])
@@ -848,13 +1784,13 @@ def main():
                 if recip_sel.overrides_sender():
                     sender_pos = recip_sel.forced_sender()
                 else:
-                    sender_pos = sender_sel.next(exclude=recip_sel.sender_exclude())
+                    sender_pos = sender_sel.next()
 
                 # Recipient
                 recip_pos = recip_sel.next(sender_pos)
 
                 # Amount
-                sender_bal = w3.eth.get_balance(accounts[sender_pos][1].address)
+                sender_bal = balance_reader.known(current_block)[sender_pos]
                 value = amount_sel.next(sender_balance_wei=sender_bal)
 
                 # Balance check
@@ -863,67 +1799,71 @@ def main():
 
             if action is None:
                 timing.record_send(current_block)
-                time.sleep(args.poll_interval)
                 continue
 
             kind, from_pos, to_pos, value_wei = action
-            from_acct = accounts[from_pos][1]
-            to_addr = accounts[to_pos][1].address
-            sender_addr = from_acct.address
-
-            # Final balance guard
-            sender_bal = w3.eth.get_balance(sender_addr)
-            if sender_bal < (value_wei + fee_buf + reserve_wei):
-                print(f"[SKIP] {sender_addr[:10]}.. insufficient for {kind}")
-                timing.record_send(current_block)
-                time.sleep(args.poll_interval)
-                continue
-
-            nonce = nonces[sender_addr]
-
-            tx = {
-                "chainId": chain_id,
-                "nonce": nonce,
-                "to": to_addr,
-                "value": int(value_wei),
-                "gas": gas_limit,
-            }
-            tx.update(fee_fields)
-
-            print(
+            from_acct = signers[from_pos]
+
+            # Wait out this sender's previous send: its outcome decides the nonce
+            prev = sender_send[from_pos]
+            if prev is not None and not prev.done():
+                wait_futures([prev])
+            settle_sends()
+            nonce = nonces[from_pos]
+
+            # No balance re-read here: known() already holds every unmined
+            # send's debit, so the check above is the guard.  Signing runs
+            # on this thread while earlier sends are in flight on send_pool.
+            if template_signer is not None:
+                raw_tx = template_signer.sign(from_pos, to_pos, nonce, value_wei, fee_fields)
+            else:
+                # One fresh dict per send, filled by a single merge of
+                # template, fees and nonce
+                tx = dict(tx_templates[to_pos], nonce=nonce, value=value_wei, **fee_fields)
+                raw_tx = sign_tx(from_acct, tx)
+
+            log(
                 f"[SEND@{current_block}] {kind}  "
-                f"{sender_addr[:10]}.. → {to_addr[:10]}..  "
-                f"val={wei_to_eth(value_wei)}  nonce={nonce}"
+                f"{short_addrs[from_pos]} → {short_addrs[to_pos]}  "
+                f"val={fmt_eth(value_wei)}  nonce={nonce}"
             )
 
-            try:
-                tx_hash = sign_and_send(w3, from_acct, tx)
-            except Exception as e:
-                print(f"[ERROR] send failed: {e}")
-                timing.record_send(current_block)
-                time.sleep(args.poll_interval)
-                continue
+            # The hash is keccak of the signed bytes, so it is known before
+            # the node answers; settle_sends() reports a failed send later.
+            # Posted raw: the bytes are already signed and fully typed, so
+            # w3's request formatters and middleware have nothing to add.
+            tx_hash = "0x" + keccak(raw_tx).hex()
+            sending[tx_hash] = sender_send[from_pos] = send_pool.submit(
+                batch.request, "eth_sendRawTransaction", ["0x" + raw_tx.hex()],
+            )
 
             # Advance local nonce immediately (not waiting for mining)
-            nonces[sender_addr] += 1
+            nonces[from_pos] += 1
+            debit_wei = value_wei + fee_buf
+            balance_reader.debit(from_pos, debit_wei)
 
             pending[tx_hash] = PendingTx(
-                tx_hash, kind, sender_addr, to_addr,
-                int(value_wei), current_block, nonce,
+                tx_hash, kind, from_pos, to_pos, value_wei,
+                current_block, nonce, debit_wei,
             )
-            print(f"  txHash: {tx_hash}")
+            log(f"  txHash: {tx_hash}")
 
             timing.record_send(current_block)
 
-            # During bursts, skip sleep to fire next tx immediately
-            if not timing.in_burst():
-                time.sleep(args.poll_interval)
+            # During bursts, skip the wait to fire next tx immediately
+            if timing.in_burst():
+                deadline = 0.0
 
     except KeyboardInterrupt:
+        flush_log()
         print(f"\nStopping. {len(pending)} pending txs.")
         for h, m in list(pending.items())[:10]:
             print(f"  {h} kind={m.kind} sent@{m.sent_at_block} nonce={m.nonce}")
         print("Done.")
+    finally:
+        flush_log()
+        send_pool.shutdown(wait=False)
+        batch.close()
 
 
 if __name__ == "__main__":